@@ -13,6 +13,7 @@ Usage:
 import argparse
 import matplotlib.pyplot as plt
 import numpy as np
+from block_type import BLOCK_TYPES_BY_ID
 from terrain_generator import ConfigurableTerrainGenerator, create_terrain_generator
 
 # Color mapping for visualization (RGB values)
@@ -36,21 +37,16 @@ def generate_terrain_map(width, height, seed=42, center_x=0, center_y=0):
     # Initialize terrain generator
     terrain_gen: ConfigurableTerrainGenerator = create_terrain_generator(seed=seed)
 
-    # Create arrays to store the map data
-    terrain_map = np.zeros((height, width), dtype=object)
+    # Generate the whole map in one batch (centered around center_x, center_y)
+    block_ids = terrain_gen.generate_chunk(
+        center_x - width // 2, center_y - height // 2, width, height
+    )
+    terrain_map = np.array(BLOCK_TYPES_BY_ID, dtype=object)[block_ids]
     color_map = np.zeros((height, width, 3))
 
-    # Generate terrain for each position
     for y in range(height):
         for x in range(width):
-            # Calculate world coordinates (centered around center_x, center_y)
-            world_x = center_x + x - width // 2
-            world_y = center_y + y - height // 2
-
-            # Generate block type
-            block_type = terrain_gen.generate_block_type(world_x, world_y)
-            terrain_map[y, x] = block_type
-            color_map[y, x] = block_type.color
+            color_map[y, x] = terrain_map[y, x].color
 
     return terrain_map, color_map
 
@@ -4,8 +4,15 @@ from block_drawing import draw_block
 
 
 class Block:
+    # Worlds hold one Block per tile; slots skip the per-instance __dict__
+    __slots__ = ("type", "walkable", "minable", "max_health", "current_health")
+
     def __init__(self, block_type: BlockType):
         self.type: BlockType = block_type
+        # Copied from the type so per-frame movement/mining checks skip the
+        # enum property lookups; a block's type never changes after creation
+        self.walkable: bool = block_type.walkable
+        self.minable: bool = block_type.minable
         self.max_health: float = self.type.mining_difficulty
         self.current_health: float = self.max_health
 
@@ -15,7 +22,7 @@ class Block:
 
     def take_damage(self, damage: float) -> bool:
         """Apply mining damage to the block. Returns True if block is destroyed."""
-        if not self.type.minable:
+        if not self.minable:
             return False
 
         self.current_health -= damage
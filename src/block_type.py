@@ -29,79 +29,103 @@ class BlockType(Enum):
     STICK = "stick"
     TORCH = "torch"
 
+    # Each property reads a value stored on the member by the loop at the end
+    # of this module, so per-tile checks don't rebuild a lookup table per call
+
     @property
     def mining_result(self) -> Optional["BlockType"]:
         """The item(s) that should be added to inventory when this block is mined"""
-        return {
-            BlockType.WOOD: BlockType.WOOD,
-            BlockType.STONE: BlockType.STONE,
-            BlockType.COAL: BlockType.COAL,
-            BlockType.DIAMOND: BlockType.DIAMOND,
-        }.get(self, None)
+        return self._mining_result
 
     @property
     def replacement_block(self) -> Optional["BlockType"]:
         """Get the block type that should replace this block when mined"""
-        replacements = {
-            BlockType.WOOD: BlockType.DIRT,
-            BlockType.STONE: BlockType.DIRT,
-            BlockType.COAL: BlockType.DIRT,
-            BlockType.DIAMOND: BlockType.DIRT,
-        }
-        return replacements.get(self, None)
+        return self._replacement_block
 
     @property
     def walkable(self) -> bool:
-        walkable_blocks = {BlockType.GRASS, BlockType.DIRT, BlockType.SAND}
-        return self in walkable_blocks
+        return self._walkable
 
     @property
     def color(self) -> pygame.Color:
-        colors = {
-            BlockType.GRASS: GRASS_GREEN,
-            BlockType.DIRT: DARK_BROWN,
-            BlockType.SAND: SAND_COLOR,
-            BlockType.WOOD: LIGHT_BROWN,
-            BlockType.STONE: GRAY,
-            BlockType.COAL: BLACK,
-            BlockType.LAVA: RED,
-            BlockType.DIAMOND: BRIGHT_BLUE,
-            BlockType.WATER: WATER_BLUE,
-        }
-        return colors.get(self, WHITE)
+        return self._color
 
     @property
     def minable(self) -> bool:
-        minable_blocks = {
-            BlockType.WOOD,
-            BlockType.STONE,
-            BlockType.DIAMOND,
-            BlockType.COAL,
-        }
-        return self in minable_blocks
+        return self._minable
 
     @property
     def mining_difficulty(self) -> float:
         # Mining difficulty in health points (higher = takes longer)
-        difficulties = {
-            BlockType.WOOD: 1.5,  # 1.5 seconds with bare hands
-            BlockType.STONE: 5.0,  # 5 seconds with bare hands
-            BlockType.COAL: 4.0,  # 4 seconds with bare hands
-            BlockType.DIAMOND: 8.0,  # 8 seconds with bare hands (very hard)
-        }
-        return difficulties.get(self, 1.0)
+        return self._mining_difficulty
 
     @property
     def sprite(self) -> Optional[pygame.Surface]:
-        sprites = {
-            BlockType.WOOD: "assets/sprites/blocks/oak_log.png",
-            BlockType.SAND: "assets/sprites/blocks/sand.png",
-            BlockType.STONE: "assets/sprites/blocks/stone.png",
-            BlockType.COAL: "assets/sprites/blocks/coal_block.png",
-            BlockType.GRASS: "assets/sprites/blocks/green_concrete_powder.png",
-            BlockType.WATER: "assets/sprites/blocks/light_blue_concrete.png",
-            BlockType.STICK: "assets/sprites/items/stick.png",
-            BlockType.TORCH: "assets/sprites/blocks/torch.png",
-        }
-        sprite = sprites.get(self)
-        return sprite_manager.load_sprite(sprite) if sprite else None
+        sprite_path = self._sprite_path
+        return sprite_manager.load_sprite(sprite_path) if sprite_path else None
+
+
+_MINING_RESULTS = {
+    BlockType.WOOD: BlockType.WOOD,
+    BlockType.STONE: BlockType.STONE,
+    BlockType.COAL: BlockType.COAL,
+    BlockType.DIAMOND: BlockType.DIAMOND,
+}
+
+_REPLACEMENTS = {
+    BlockType.WOOD: BlockType.DIRT,
+    BlockType.STONE: BlockType.DIRT,
+    BlockType.COAL: BlockType.DIRT,
+    BlockType.DIAMOND: BlockType.DIRT,
+}
+
+_WALKABLE_BLOCKS = frozenset({BlockType.GRASS, BlockType.DIRT, BlockType.SAND})
+
+_COLORS = {
+    BlockType.GRASS: GRASS_GREEN,
+    BlockType.DIRT: DARK_BROWN,
+    BlockType.SAND: SAND_COLOR,
+    BlockType.WOOD: LIGHT_BROWN,
+    BlockType.STONE: GRAY,
+    BlockType.COAL: BLACK,
+    BlockType.LAVA: RED,
+    BlockType.DIAMOND: BRIGHT_BLUE,
+    BlockType.WATER: WATER_BLUE,
+}
+
+_MINABLE_BLOCKS = frozenset(
+    {BlockType.WOOD, BlockType.STONE, BlockType.DIAMOND, BlockType.COAL}
+)
+
+_MINING_DIFFICULTIES = {
+    BlockType.WOOD: 1.5,  # 1.5 seconds with bare hands
+    BlockType.STONE: 5.0,  # 5 seconds with bare hands
+    BlockType.COAL: 4.0,  # 4 seconds with bare hands
+    BlockType.DIAMOND: 8.0,  # 8 seconds with bare hands (very hard)
+}
+
+_SPRITE_PATHS = {
+    BlockType.WOOD: "assets/sprites/blocks/oak_log.png",
+    BlockType.SAND: "assets/sprites/blocks/sand.png",
+    BlockType.STONE: "assets/sprites/blocks/stone.png",
+    BlockType.COAL: "assets/sprites/blocks/coal_block.png",
+    BlockType.GRASS: "assets/sprites/blocks/green_concrete_powder.png",
+    BlockType.WATER: "assets/sprites/blocks/light_blue_concrete.png",
+    BlockType.STICK: "assets/sprites/items/stick.png",
+    BlockType.TORCH: "assets/sprites/blocks/torch.png",
+}
+
+for _block_type in BlockType:
+    _block_type._mining_result = _MINING_RESULTS.get(_block_type)
+    _block_type._replacement_block = _REPLACEMENTS.get(_block_type)
+    _block_type._walkable = _block_type in _WALKABLE_BLOCKS
+    _block_type._color = _COLORS.get(_block_type, WHITE)
+    _block_type._minable = _block_type in _MINABLE_BLOCKS
+    _block_type._mining_difficulty = _MINING_DIFFICULTIES.get(_block_type, 1.0)
+    _block_type._sprite_path = _SPRITE_PATHS.get(_block_type)
+del _block_type
+
+# Compact integer ids for block types, used for whole-chunk arrays. Ids follow
+# the enum's declaration order, so new block types must be appended at the end
+BLOCK_TYPES_BY_ID = tuple(BlockType)
+BLOCK_ID = {block_type: block_id for block_id, block_type in enumerate(BlockType)}
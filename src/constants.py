@@ -5,6 +5,7 @@ WINDOW_SIZE = (1600, GAME_HEIGHT + INVENTORY_HEIGHT)
 GRID_SIZE = 32  # Size of each grid cell in pixels
 GRID_WIDTH = WINDOW_SIZE[0] // GRID_SIZE
 GRID_HEIGHT = GAME_HEIGHT // GRID_SIZE
+FRAME_RATE = 60  # Target frames per second for the main loop
 
 # Colors
 BLACK = (0, 0, 0)
@@ -13,7 +13,7 @@ from pygame.locals import (
 from menu import MenuSystem
 from world_storage import WorldStorage
 from crafting_ui import CraftingUI
-from constants import WINDOW_SIZE
+from constants import WINDOW_SIZE, FRAME_RATE
 from enum import Enum
 
 
@@ -55,7 +55,7 @@ class Game:
     def run(self):
         """Main game loop"""
         while self.running:
-            dt = self.clock.tick(60) / 1000.0
+            dt = self.clock.tick(FRAME_RATE) / 1000.0
             self._handle_events()
             self._update(dt)
             self._render()
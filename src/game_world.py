@@ -2,6 +2,7 @@ import pygame
 import math
 from terrain_generator import ConfigurableTerrainGenerator, create_terrain_generator
 from block import Block
+from block_type import BLOCK_TYPES_BY_ID
 from player import Player
 from camera import Camera
 from lighting import lighting_system
@@ -98,17 +99,17 @@ class GameWorld:
 
     def _generate_chunk(self, chunk_x, chunk_y):
         """Generate a chunk using the new noise-based terrain system"""
+        # Generate the whole chunk in one batch rather than tile by tile
+        block_ids = self.terrain_generator.generate_chunk(
+            chunk_x * self.chunk_size,
+            chunk_y * self.chunk_size,
+            self.chunk_size,
+            self.chunk_size,
+        ).tolist()
         chunk = {}
-        for y in range(self.chunk_size):
-            for x in range(self.chunk_size):
-                world_x = chunk_x * self.chunk_size + x
-                world_y = chunk_y * self.chunk_size + y
-
-                # Use terrain generator to determine block type
-                block_type = self.terrain_generator.generate_block_type(
-                    world_x, world_y
-                )
-                chunk[(x, y)] = Block(block_type)
+        for y, row in enumerate(block_ids):
+            for x, block_id in enumerate(row):
+                chunk[(x, y)] = Block(BLOCK_TYPES_BY_ID[block_id])
 
         self.chunks[(chunk_x, chunk_y)] = chunk
 
@@ -166,7 +167,7 @@ class GameWorld:
                         and self.player.mining_target == (world_x, world_y)
                     )
                     mining_progress = 0.0
-                    if is_being_mined and block.type.minable:
+                    if is_being_mined and block.minable:
                         mining_progress = 1.0 - (
                             block.current_health / block.max_health
                         )
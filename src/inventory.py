@@ -1,4 +1,4 @@
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 from block_type import BlockType
 
 
@@ -10,12 +10,13 @@ class Inventory:
     ):
         self.inventory = inventory or {}
         self.active_slot = active_slot
+        # (count, items) from the last get_top_inventory_items call, cleared on change
+        self._top_cache: Optional[Tuple[int, List[Tuple[BlockType, int]]]] = None
 
     def add(self, block_type: BlockType):
-        if block_type in self.inventory:
-            self.inventory[block_type] += 1
-        else:
-            self.inventory[block_type] = 1
+        inventory = self.inventory
+        inventory[block_type] = inventory.get(block_type, 0) + 1
+        self._top_cache = None
 
     def remove(self, block_type: BlockType):
         # Remove one from inventory
@@ -23,11 +24,16 @@ class Inventory:
         # Remove the block type entirely if count reaches 0
         if self.inventory[block_type] == 0:
             del self.inventory[block_type]
+        self._top_cache = None
 
     def get_top_inventory_items(self, count=5):
-        # Get items in stable order (insertion order)
-        items = list(self.inventory.items())
-        return items[:count]
+        # Get items in stable order (insertion order), reusing the cached list
+        # until the inventory changes. Callers must treat the result as read-only.
+        cache = self._top_cache
+        if cache is None or cache[0] != count:
+            cache = (count, list(self.inventory.items())[:count])
+            self._top_cache = cache
+        return cache[1]
 
     def get_active_block_type(self) -> Optional[BlockType]:
         # Get the block type in the active slot
@@ -12,6 +12,7 @@ from pygame.locals import (
 from constants import WINDOW_SIZE, BLACK, WHITE
 from enum import Enum
 from world_storage import WorldStorage
+from sprites import sprite_manager
 
 
 class MenuOption(Enum):
@@ -34,16 +35,8 @@ class MenuSystem:
         self.window_width = WINDOW_SIZE[0]
         self.window_height = WINDOW_SIZE[1]
 
-        # Load logo
-        self.logo_original = pygame.image.load("assets/logo/minecraft2d_logo.png")
-        self.logo_original = self.logo_original.convert_alpha()
-        # Resize logo to a fixed width while maintaining aspect ratio
-        logo_width = 700  # Increased since logo is now cropped tighter
-        aspect_ratio = self.logo_original.get_height() / self.logo_original.get_width()
-        logo_height = int(logo_width * aspect_ratio)
-        self.logo = pygame.transform.smoothscale(
-            self.logo_original, (logo_width, logo_height)
-        )
+        # Load logo (decoded and scaled once, shared by every menu)
+        self.logo = sprite_manager.load_logo()
 
         # Track clickable rectangles for menu options
         self.clickable_rects = []
@@ -18,7 +18,23 @@ from sprites import sprite_manager
 from inventory import Inventory
 from block_type import BlockType
 import pygame
-import os
+
+# Each movement key gets its own bit so that releasing one of two keys bound to
+# the same direction (e.g. W and UP) doesn't cancel the one still held
+_KEY_BIT = {
+    K_w: 1 << 0,
+    K_UP: 1 << 1,
+    K_s: 1 << 2,
+    K_DOWN: 1 << 3,
+    K_a: 1 << 4,
+    K_LEFT: 1 << 5,
+    K_d: 1 << 6,
+    K_RIGHT: 1 << 7,
+}
+_NORTH_BITS = _KEY_BIT[K_w] | _KEY_BIT[K_UP]
+_SOUTH_BITS = _KEY_BIT[K_s] | _KEY_BIT[K_DOWN]
+_WEST_BITS = _KEY_BIT[K_a] | _KEY_BIT[K_LEFT]
+_EAST_BITS = _KEY_BIT[K_d] | _KEY_BIT[K_RIGHT]
 
 
 class Player:
@@ -29,6 +45,9 @@ class Player:
         self.inventory: Inventory = Inventory()
         self.is_mining = False
         self.mining_target = None  # (x, y) coordinates of block being mined
+        # Block being mined; the chunk keeps the same Block object until it is
+        # replaced, so this saves a world lookup every frame while mining
+        self.mining_block = None
         self.mining_damage_rate = 1.0  # Base mining rate (damage per second)
         self.just_finished_mining = (
             False  # Prevent immediate block placement after mining
@@ -39,14 +58,14 @@ class Player:
 
         # Movement system
         self.movement_speed = 6.0  # blocks per second
-        self.pressed_keys = set()  # Track currently pressed keys
+        self._dir_mask = 0  # Bitmask of currently pressed movement keys
         self.movement_timer = 0.0  # Accumulator for movement timing
         self.move_interval = 1.0 / self.movement_speed  # Time between moves
 
     def handle_keydown(self, key, game=None):
         # Handle movement keys (both WASD and arrow keys)
-        if key in [K_w, K_a, K_s, K_d, K_UP, K_DOWN, K_LEFT, K_RIGHT]:
-            self.pressed_keys.add(key)
+        if key in _KEY_BIT:
+            self._dir_mask |= _KEY_BIT[key]
             # Handle immediate orientation change if needed
             target_orientation = None
             if key == K_a or key == K_LEFT:
@@ -78,8 +97,8 @@ class Player:
 
     def handle_keyup(self, key, game):
         # Handle movement keys (both WASD and arrow keys)
-        if key in [K_w, K_a, K_s, K_d, K_UP, K_DOWN, K_LEFT, K_RIGHT]:
-            self.pressed_keys.discard(key)
+        if key in _KEY_BIT:
+            self._dir_mask &= ~_KEY_BIT[key]
         elif key == K_SPACE:
             if self.is_mining:
                 self.stop_mining(game)
@@ -89,46 +108,53 @@ class Player:
             self.just_finished_mining = False
 
     def update(self, dt, game=None):
+        # Fast path: nothing to do while idle (the common case between key events)
+        if game is None or not (self._dir_mask or self.is_mining):
+            return
+
         # Handle continuous movement
-        if self.pressed_keys and game:
+        if self._dir_mask:
             self.process_movement(dt, game)
 
         # Handle continuous mining
-        if self.is_mining and game and self.mining_target:
+        if self.is_mining and self.mining_target:
             self.process_mining(dt, game)
 
     def process_movement(self, dt, game):
         """Process continuous movement based on held keys"""
-        # Accumulate time
-        self.movement_timer += dt
+        # Hot attributes are bound to locals and the timer is written back once
+        timer = self.movement_timer + dt
 
         # Check if enough time has passed since last move
-        if self.movement_timer < self.move_interval:
+        if timer < self.move_interval:
+            self.movement_timer = timer
             return
 
         # Determine movement direction based on pressed keys
         dx, dy = 0, 0
         target_orientation = None
 
-        # Priority: most recent key press determines direction
-        # Check keys in order of typical priority (check both WASD and arrow keys)
-        if K_w in self.pressed_keys or K_UP in self.pressed_keys:
+        # Check directions in order of typical priority (north, south, west, east)
+        mask = self._dir_mask
+        if mask & _NORTH_BITS:
             target_orientation = "north"
             dy = -1
-        elif K_s in self.pressed_keys or K_DOWN in self.pressed_keys:
+        elif mask & _SOUTH_BITS:
             target_orientation = "south"
             dy = 1
-        elif K_a in self.pressed_keys or K_LEFT in self.pressed_keys:
+        elif mask & _WEST_BITS:
             target_orientation = "west"
             dx = -1
-        elif K_d in self.pressed_keys or K_RIGHT in self.pressed_keys:
+        elif mask & _EAST_BITS:
             target_orientation = "east"
             dx = 1
 
         # Move if we have a direction and are facing the right way
         if target_orientation and self.orientation == target_orientation:
             if self.move(dx, dy, game):
-                self.movement_timer = 0.0  # Reset timer after successful move
+                timer = 0.0  # Reset timer after successful move
+
+        self.movement_timer = timer
 
     def move(self, dx, dy, game):
         new_x = self.world_x + dx
@@ -136,7 +162,7 @@ class Player:
 
         # Check if target block is walkable
         target_block = game.get_block(new_x, new_y)
-        if target_block and target_block.type.walkable:
+        if target_block and target_block.walkable:
             self.world_x = new_x
             self.world_y = new_y
             # Stop mining if player moves
@@ -164,30 +190,30 @@ class Player:
         target_x, target_y = self.get_target_position()
         target_block = game.get_block(target_x, target_y)
 
-        if target_block and target_block.type.minable:
+        if target_block and target_block.minable:
             self.is_mining = True
             self.mining_target = (target_x, target_y)
+            self.mining_block = target_block
 
     def stop_mining(self, game):
         """Stop mining and reset block health"""
-        if self.is_mining and self.mining_target and game:
-            target_x, target_y = self.mining_target
-            target_block = game.get_block(target_x, target_y)
-            if target_block:
-                target_block.reset_health()
+        if self.is_mining and self.mining_block:
+            self.mining_block.reset_health()
 
         self.is_mining = False
         self.mining_target = None
+        self.mining_block = None
 
     def process_mining(self, dt, game):
         """Process mining damage over time"""
-        if not self.mining_target:
+        mining_target = self.mining_target
+        if not mining_target:
             return
 
-        target_x, target_y = self.mining_target
-        target_block = game.get_block(target_x, target_y)
+        target_x, target_y = mining_target
+        target_block = self.mining_block
 
-        if not target_block or not target_block.type.minable:
+        if not target_block or not target_block.minable:
             self.stop_mining(game)
             return
 
@@ -213,6 +239,7 @@ class Player:
         # Stop mining and set flag to prevent immediate placement
         self.is_mining = False
         self.mining_target = None
+        self.mining_block = None
         self.just_finished_mining = True
 
     def add_to_inventory(self, block_type: BlockType):
@@ -227,15 +254,7 @@ class Player:
     def load_sprites_if_needed(self):
         """Load sprites if not already loaded (after pygame display is initialized)"""
         if not self.sprites:
-            base_path = "assets/sprites/player/"
-            directions = ["north", "south", "east", "west"]
-
-            for direction in directions:
-                filename = f"steve_{direction}.png"
-                filepath = os.path.join(base_path, filename)
-
-                sprite = sprite_manager.load_sprite(filepath)
-                self.sprites[direction] = sprite
+            self.sprites = sprite_manager.load_player_sprites()
 
     def get_current_sprite(self) -> pygame.Surface:
         """Get the sprite for the current orientation, or None if using fallback color"""
@@ -251,7 +270,7 @@ class Player:
         block_type = self.get_active_block_type()
         target_block = game.get_block(target_x, target_y)
 
-        if block_type and target_block and target_block.type.walkable:
+        if block_type and target_block and target_block.walkable:
             # Check if we have the block in inventory
             if self.inventory.has_block_type(block_type):
                 # Place the block
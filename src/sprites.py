@@ -1,12 +1,22 @@
 import pygame
-import os
 from constants import GRID_SIZE
 from typing import Dict
 
+# Player sprite paths by facing direction
+_PLAYER_SPRITE_PATHS = [
+    (direction, f"assets/sprites/player/steve_{direction}.png")
+    for direction in ("north", "south", "east", "west")
+]
+
+_LOGO_PATH = "assets/logo/minecraft2d_logo.png"
+_LOGO_WIDTH = 700  # Increased since logo is now cropped tighter
+
 
 class SpriteManager:
     def __init__(self):
         self.sprites = {}
+        self._player_sprite_cache = None
+        self._logo_cache = None
 
     def load_sprite(
         self, path, target_width=GRID_SIZE, target_height=GRID_SIZE
@@ -27,20 +37,25 @@ class SpriteManager:
         return scaled
 
     def load_player_sprites(self) -> Dict[str, pygame.Surface]:
-        """Load all player direction sprites"""
-        base_path = "assets/sprites/player/"
-
-        player_sprites = {}
-        directions = ["north", "south", "east", "west"]
-
-        for direction in directions:
-            filename = f"steve_{direction}.png"
-            filepath = os.path.join(base_path, filename)
-
-            sprite = self.load_sprite(filepath)
-            player_sprites[direction] = sprite
-
-        return player_sprites
+        """Load all player direction sprites (cached after the first call)"""
+        if self._player_sprite_cache is None:
+            self._player_sprite_cache = {
+                direction: self.load_sprite(path)
+                for direction, path in _PLAYER_SPRITE_PATHS
+            }
+        return self._player_sprite_cache
+
+    def load_logo(self) -> pygame.Surface:
+        """Load the menu logo at its fixed width (cached after the first call)"""
+        if self._logo_cache is None:
+            original = pygame.image.load(_LOGO_PATH).convert_alpha()
+            # Resize logo to a fixed width while maintaining aspect ratio
+            aspect_ratio = original.get_height() / original.get_width()
+            logo_height = int(_LOGO_WIDTH * aspect_ratio)
+            self._logo_cache = pygame.transform.smoothscale(
+                original, (_LOGO_WIDTH, logo_height)
+            )
+        return self._logo_cache
 
 
 # Global sprite manager instance
@@ -6,11 +6,33 @@ configuration system to make it much easier to add new block types
 and adjust distributions.
 """
 
-import random
+from bisect import bisect_right
 import noise
+import numpy as np
 from terrain_config import TerrainConfig, DEFAULT_CONFIG
-from block_type import BlockType
-from typing import Optional
+from block_type import BLOCK_ID, BlockType
+from typing import List, Optional, Tuple
+
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+
+# Add large offset to avoid boring area around origin
+# This ensures the starting area has interesting terrain variation
+# Use prime numbers to ensure we get into more interesting noise areas
+_NOISE_OFFSET_X = 10007.0
+_NOISE_OFFSET_Y = 10009.0
+
+# pnoise2's default repeatx/repeaty, needed to pass base positionally
+_NOISE_REPEAT = 1024
+
+
+def _combine_bands(large_scale, medium_scale, small_scale):
+    """Weighted combination of the base noise bands, normalized to [0,1]
+
+    Works on floats and NumPy arrays alike, so the per-tile and chunk paths
+    share it.
+    """
+    combined = 0.5 * large_scale + 0.3 * medium_scale + 0.2 * small_scale
+    return (combined + 1) / 2
 
 
 class ConfigurableTerrainGenerator:
@@ -25,170 +47,387 @@ class ConfigurableTerrainGenerator:
         if issues:
             raise ValueError(f"Configuration validation failed: {issues}")
 
-    def get_base_terrain_noise(self, world_x, world_y):
-        """Generate base terrain noise value using configuration"""
-        params = self.config.noise_params
+        # Bumped by every rebuild; get_configuration_summary is cached per version
+        self._config_version = 0
+        self._cached_summary = None
+        self._cached_summary_version = None
+        self.rebuild()
 
-        # Add large offset to avoid boring area around origin
-        # This ensures the starting area has interesting terrain variation
-        # Use prime numbers to ensure we get into more interesting noise areas
-        offset_x = world_x + 10007.0
-        offset_y = world_y + 10009.0
+    def rebuild(self):
+        """Recompute everything derived from the configuration
 
-        # Large-scale terrain features (continents, oceans)
-        large_scale = noise.pnoise2(
-            offset_x * params["large_scale"]["scale"],
-            offset_y * params["large_scale"]["scale"],
-            octaves=params["large_scale"]["octaves"],
-            persistence=params["large_scale"]["persistence"],
-            lacunarity=params["large_scale"]["lacunarity"],
-            base=self.seed,
+        Generation only reads these precomputed values, never the config
+        itself, so call this after editing the current config in place.
+        """
+        self._config_version += 1
+
+        # Multiply by the reciprocal of the stretch range instead of dividing
+        params = self.config.noise_params
+        self._stretch_min = params["noise_stretch_min"]
+        self._stretch_scale = 1.0 / (
+            params["noise_stretch_max"] - params["noise_stretch_min"]
         )
 
-        # Medium-scale terrain features (biomes, regions)
-        medium_scale = noise.pnoise2(
-            offset_x * params["medium_scale"]["scale"],
-            offset_y * params["medium_scale"]["scale"],
-            octaves=params["medium_scale"]["octaves"],
-            persistence=params["medium_scale"]["persistence"],
-            lacunarity=params["medium_scale"]["lacunarity"],
-            base=self.seed + 100,
+        self._stone_threshold = params["stone_threshold"]
+        self._lava_pool_threshold = params["lava_pool_threshold"]
+
+        # (scale, noise_args) per noise band, so sampling doesn't walk the nested
+        # noise_params dicts per tile. noise_args are pnoise2's arguments after
+        # x and y, passed positionally: parsing keyword arguments costs more
+        # than the noise itself at these octave counts
+        def band(scale, octaves, persistence, lacunarity, base):
+            return scale, (
+                octaves,
+                persistence,
+                lacunarity,
+                _NOISE_REPEAT,
+                _NOISE_REPEAT,
+                base,
+            )
+
+        def configured_band(name, base_offset):
+            band_params = params[name]
+            return band(
+                band_params["scale"],
+                band_params["octaves"],
+                band_params["persistence"],
+                band_params["lacunarity"],
+                self.seed + base_offset,
+            )
+
+        self._large_band = configured_band("large_scale", 0)
+        self._medium_band = configured_band("medium_scale", 100)
+        self._small_band = configured_band("small_scale", 200)
+        self._feature_band = band(
+            params["feature_scale"], 3, 0.6, 2.0, self.seed + 1000
+        )
+        # Scaling by 0.5 is exact, so this matches offset * feature_scale * 0.5
+        self._lava_band = band(
+            params["feature_scale"] * 0.5, 2, 0.4, 2.0, self.seed + 2000
         )
 
-        # Small-scale height variation (local details)
-        small_scale = noise.pnoise2(
-            offset_x * params["small_scale"]["scale"],
-            offset_y * params["small_scale"]["scale"],
-            octaves=params["small_scale"]["octaves"],
-            persistence=params["small_scale"]["persistence"],
-            lacunarity=params["small_scale"]["lacunarity"],
-            base=self.seed + 200,
+        # Thresholds and BlockType table used to classify a whole chunk at once
+        layers = self.config.base_layers
+        self._thresholds = np.array([layer.threshold for layer in layers])
+
+        # Bucket i holds noise in [threshold[i-1], threshold[i]), matching the
+        # first-layer-below-threshold scan; anything above maps to the last layer
+        layer_names = [layer.name for layer in layers]
+        layer_names.append(layer_names[-1] if layers else BlockType.STONE)
+        self._threshold_list = [layer.threshold for layer in layers]
+        self._layer_names = tuple(layer_names)
+        self._layer_lut = np.array(
+            [BLOCK_ID[name] for name in layer_names], dtype=np.int8
+        )
+
+        # Feature rules as parallel arrays, so generate_chunk can apply each rule
+        # to the whole chunk with one mask; _rule_base_mask[r] is indexed by the
+        # layer bucket from np.digitize
+        rules = self.config.feature_rules
+        self._rule_base_mask = np.array(
+            [[name in rule.base_terrain for name in layer_names] for rule in rules],
+            dtype=bool,
+        ).reshape(len(rules), len(layer_names))
+        # Per-tile path: for each base terrain, only the rules that can spawn
+        # on it, in order, as (channel, name, noise threshold, spawn chance,
+        # requires deep, lava pool) tuples. The channel is the rule's index, which
+        # selects its spawn roll
+        self._rules_by_terrain = {
+            terrain: tuple(
+                (
+                    channel,
+                    rule.name,
+                    rule.noise_threshold,
+                    rule.spawn_chance,
+                    rule.requires_deep,
+                    rule.name is BlockType.LAVA and rule.requires_deep,
+                )
+                for channel, rule in enumerate(rules)
+                if terrain in rule.base_terrain
+            )
+            for terrain in set(layer_names)
+        }
+        self._rule_spawn_chances = tuple(rule.spawn_chance for rule in rules)
+        self._rule_noise_threshold = np.array(
+            [rule.noise_threshold for rule in rules], dtype=np.float64
+        )
+        self._rule_requires_deep = np.array(
+            [rule.requires_deep for rule in rules], dtype=bool
+        )
+        self._rule_ids = np.array(
+            [BLOCK_ID[rule.name] for rule in rules], dtype=np.int8
+        )
+        self._rule_lava_pool = np.array(
+            [rule.name is BlockType.LAVA and rule.requires_deep for rule in rules],
+            dtype=bool,
         )
 
-        # Weighted combination
-        combined = 0.5 * large_scale + 0.3 * medium_scale + 0.2 * small_scale
+    def classify_base(self, noise_values: np.ndarray) -> np.ndarray:
+        """Vectorized get_base_terrain_type, returning BLOCK_ID values (int8)"""
+        return self._layer_lut[np.digitize(noise_values, self._thresholds)]
+
+    def get_base_terrain_noise(self, world_x, world_y):
+        """Generate base terrain noise value using configuration"""
+        offset_x = world_x + _NOISE_OFFSET_X
+        offset_y = world_y + _NOISE_OFFSET_Y
+
+        # Large-scale terrain features (continents, oceans)
+        scale, noise_args = self._large_band
+        large_scale = noise.pnoise2(offset_x * scale, offset_y * scale, *noise_args)
+
+        # Medium-scale terrain features (biomes, regions)
+        scale, noise_args = self._medium_band
+        medium_scale = noise.pnoise2(offset_x * scale, offset_y * scale, *noise_args)
+
+        # Small-scale height variation (local details)
+        scale, noise_args = self._small_band
+        small_scale = noise.pnoise2(offset_x * scale, offset_y * scale, *noise_args)
 
-        # Normalize to [0,1] range
-        normalized = (combined + 1) / 2
+        # Weighted combination, normalized to [0,1] range
+        normalized = _combine_bands(large_scale, medium_scale, small_scale)
 
         # Stretch the distribution to use full [0,1] range
-        min_expected = params["noise_stretch_min"]
-        max_expected = params["noise_stretch_max"]
-        stretched = (normalized - min_expected) / (max_expected - min_expected)
-        enhanced = max(0, min(1, stretched))  # Clamp to [0,1]
+        stretched = (normalized - self._stretch_min) * self._stretch_scale
+        # Clamp to [0,1]; plain comparisons avoid two builtin calls per tile and
+        # always return a float, like np.clip in generate_chunk
+        enhanced = 0.0 if stretched < 0.0 else 1.0 if stretched > 1.0 else stretched
 
         return enhanced
 
     def get_base_terrain_type(self, world_x, world_y) -> BlockType:
         """Determine base terrain type using configuration"""
         noise_value = self.get_base_terrain_noise(world_x, world_y)
+        return self.base_terrain_from_noise(noise_value)
 
-        # Find the appropriate terrain layer based on thresholds
-        for layer in self.config.base_layers:
-            if noise_value < layer.threshold:
-                return layer.name
-
-        # If no threshold matched, return the last layer
-        return (
-            self.config.base_layers[-1].name
-            if self.config.base_layers
-            else BlockType.STONE
-        )
+    def base_terrain_from_noise(self, noise_value) -> BlockType:
+        """Base terrain type for an already computed base noise value"""
+        # The first layer whose threshold is above the noise value (thresholds
+        # are validated to be ascending); past the last one, the last layer
+        return self._layer_names[bisect_right(self._threshold_list, noise_value)]
 
     def is_deep_underground(self, world_x, world_y):
         """Check if location is in deep underground area"""
         noise_value = self.get_base_terrain_noise(world_x, world_y)
-        return noise_value >= self.config.noise_params["stone_threshold"]
+        return self.is_deep_underground_from_noise(noise_value)
+
+    def is_deep_underground_from_noise(self, noise_value):
+        """Deep underground check for base noise (a value or an array)"""
+        return noise_value >= self._stone_threshold
 
     def get_feature_noise(self, world_x, world_y):
         """Generate 2D feature placement noise"""
         # Use same offset as base terrain for consistency
-        offset_x = world_x + 10007.0
-        offset_y = world_y + 10009.0
-
-        return noise.pnoise2(
-            offset_x * self.config.noise_params["feature_scale"],
-            offset_y * self.config.noise_params["feature_scale"],
-            octaves=3,
-            persistence=0.6,
-            lacunarity=2.0,
-            base=self.seed + 1000,
-        )
+        offset_x = world_x + _NOISE_OFFSET_X
+        offset_y = world_y + _NOISE_OFFSET_Y
+
+        scale, noise_args = self._feature_band
+        return noise.pnoise2(offset_x * scale, offset_y * scale, *noise_args)
 
-    def should_place_lava_pool(self, world_x, world_y):
-        """Determine if lava should form a pool at this location"""
-        if not self.is_deep_underground(world_x, world_y):
+    def should_place_lava_pool(self, world_x, world_y, base_noise=None):
+        """Determine if lava should form a pool at this location
+
+        Pass base_noise if it is already known to skip recomputing it.
+        """
+        if base_noise is None:
+            base_noise = self.get_base_terrain_noise(world_x, world_y)
+        if not self.is_deep_underground_from_noise(base_noise):
             return False
+        return self._lava_noise_passes(world_x, world_y)
 
+    def _lava_noise_passes(self, world_x, world_y):
+        """Lava pool noise check, for callers that already know the tile is deep"""
         # Use same offset as base terrain for consistency
-        offset_x = world_x + 10007.0
-        offset_y = world_y + 10009.0
+        offset_x = world_x + _NOISE_OFFSET_X
+        offset_y = world_y + _NOISE_OFFSET_Y
 
         # Use different noise for lava pool formation
-        lava_noise = noise.pnoise2(
-            offset_x * self.config.noise_params["feature_scale"] * 0.5,
-            offset_y * self.config.noise_params["feature_scale"] * 0.5,
-            octaves=2,
-            persistence=0.4,
-            lacunarity=2.0,
-            base=self.seed + 2000,
-        )
+        scale, noise_args = self._lava_band
+        lava_noise = noise.pnoise2(offset_x * scale, offset_y * scale, *noise_args)
 
-        return lava_noise > self.config.noise_params["lava_pool_threshold"]
+        return lava_noise > self._lava_pool_threshold
+
+    def _compute_base(self, world_x, world_y) -> Tuple[float, BlockType, bool]:
+        """Base noise, base terrain and deep flag from a single noise evaluation"""
+        base_noise = self.get_base_terrain_noise(world_x, world_y)
+        return (
+            base_noise,
+            self.base_terrain_from_noise(base_noise),
+            base_noise >= self._stone_threshold,
+        )
 
     def generate_block_type(self, world_x, world_y) -> BlockType:
         """Generate the final block type using configuration"""
         # Step 1: Get base terrain
-        base_terrain = self.get_base_terrain_type(world_x, world_y)
+        _, base_terrain, is_deep = self._compute_base(world_x, world_y)
 
         # Step 2: Get noise values for feature placement
         feature_noise = self.get_feature_noise(world_x, world_y)
-        is_deep = self.is_deep_underground(world_x, world_y)
-
-        # Seed random generator for consistent results
-        random.seed(world_x * 10000 + world_y + self.seed)
 
         # Step 3: Process feature rules in order
-        for rule in self.config.feature_rules:
-            # Check if this rule applies to the current base terrain
-            if base_terrain not in rule.base_terrain:
-                continue
+        return self._apply_feature_rules(
+            world_x, world_y, base_terrain, feature_noise, is_deep
+        )
+
+    def _hash_chance(self, world_x, world_y, channel) -> float:
+        """Scalar _hash_uniform in plain integers, for single-tile queries
+
+        Gives exactly the same value as _hash_uniform without the NumPy
+        overhead, which dominates when hashing one tile at a time.
+        """
+        key = (
+            ((world_x * 0x9E3779B97F4A7C15) & _MASK64)
+            ^ ((world_y << 32) & _MASK64)
+            ^ (((self.seed << 8) + channel) & _MASK64)
+        )
+
+        # splitmix64 finalizer
+        key ^= key >> 30
+        key = (key * 0xBF58476D1CE4E5B9) & _MASK64
+        key ^= key >> 27
+        key = (key * 0x94D049BB133111EB) & _MASK64
+        key ^= key >> 31
+
+        return (key >> 11) * (1.0 / (1 << 53))
+
+    def _hash_uniform(self, world_x, world_y, channel) -> np.ndarray:
+        """Deterministic uniform floats in [0, 1) for integer coordinate arrays
+
+        A splitmix64 hash of (x, y, seed, channel), so every tile gets its own
+        repeatable draw without seeding a random generator per tile. The
+        coordinate arrays are broadcast against each other.
+        """
+        x_bits = np.asarray(world_x, dtype=np.int64).view(np.uint64)
+        y_bits = np.asarray(world_y, dtype=np.int64).view(np.uint64)
+        key = (
+            (x_bits * np.uint64(0x9E3779B97F4A7C15))
+            ^ (y_bits << np.uint64(32))
+            ^ np.uint64(((self.seed << 8) + channel) & _MASK64)
+        )
+
+        # splitmix64 finalizer
+        key ^= key >> np.uint64(30)
+        key *= np.uint64(0xBF58476D1CE4E5B9)
+        key ^= key >> np.uint64(27)
+        key *= np.uint64(0x94D049BB133111EB)
+        key ^= key >> np.uint64(31)
+
+        # Top 53 bits give an evenly spaced double in [0, 1)
+        return (key >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+
+    def roll_feature_spawns(self, world_x, world_y) -> List[np.ndarray]:
+        """Spawn-chance roll for each feature rule (in order) at every tile"""
+        return [
+            self._hash_uniform(world_x, world_y, channel) < spawn_chance
+            for channel, spawn_chance in enumerate(self._rule_spawn_chances)
+        ]
+
+    def _apply_feature_rules(
+        self, world_x, world_y, base_terrain, feature_noise, is_deep
+    ) -> BlockType:
+        """Return the first feature rule that fires here, or the base terrain"""
+        for rule in self._rules_by_terrain.get(base_terrain, ()):
+            channel, name, threshold, chance, requires_deep, lava_pool = rule
 
             # Check if deep underground requirement is met
-            if rule.requires_deep and not is_deep:
+            if requires_deep and not is_deep:
                 continue
 
-            # Check noise threshold and spawn chance
+            # Check noise threshold, then roll the spawn chance
             if (
-                feature_noise > rule.noise_threshold
-                and random.random() < rule.spawn_chance
+                feature_noise > threshold
+                and self._hash_chance(world_x, world_y, channel) < chance
             ):
-                # Special case for lava pools
-                if rule.name == BlockType.LAVA and rule.requires_deep:
-                    if self.should_place_lava_pool(world_x, world_y):
-                        return rule.name
+                # Special case for lava pools (the deep check already passed)
+                if lava_pool:
+                    if self._lava_noise_passes(world_x, world_y):
+                        return name
                 else:
-                    return rule.name
+                    return name
 
         # No feature rule matched, return base terrain
         return base_terrain
 
+    def generate_chunk(self, x0, y0, width, height) -> np.ndarray:
+        """Generate block types for a width x height area starting at (x0, y0)
+
+        Returns a (height, width) int8 array of BLOCK_ID values indexed as
+        [y, x], matching generate_block_type for every tile. Each noise band
+        is sampled once per tile, and the combine, stretch, layer lookup and
+        feature rules run over the whole area in NumPy.
+        """
+        # Same offsets as the per-tile path so both produce the same terrain
+        offsets_x = [world_x + _NOISE_OFFSET_X for world_x in range(x0, x0 + width)]
+        offsets_y = [world_y + _NOISE_OFFSET_Y for world_y in range(y0, y0 + height)]
+
+        def sample(scale, noise_args):
+            return np.array(
+                [
+                    [
+                        noise.pnoise2(offset_x * scale, offset_y * scale, *noise_args)
+                        for offset_x in offsets_x
+                    ]
+                    for offset_y in offsets_y
+                ],
+                dtype=np.float64,
+            )
+
+        large_scale = sample(*self._large_band)
+        medium_scale = sample(*self._medium_band)
+        small_scale = sample(*self._small_band)
+
+        normalized = _combine_bands(large_scale, medium_scale, small_scale)
+        stretched = (normalized - self._stretch_min) * self._stretch_scale
+        enhanced = np.clip(stretched, 0.0, 1.0)
+
+        buckets = np.digitize(enhanced, self._thresholds)
+        is_deep = self.is_deep_underground_from_noise(enhanced)
+        feature_noise = sample(*self._feature_band)
+        spawn_rolls = self.roll_feature_spawns(
+            np.arange(x0, x0 + width)[np.newaxis, :],
+            np.arange(y0, y0 + height)[:, np.newaxis],
+        )
+
+        # Apply the feature rules in order, one whole-chunk mask per rule; a tile
+        # takes the first rule that fires, as in _apply_feature_rules
+        blocks = self._layer_lut[buckets]
+        undecided = np.ones((height, width), dtype=bool)
+        for index in range(len(self._rule_spawn_chances)):
+            fires = (
+                undecided
+                & self._rule_base_mask[index][buckets]
+                & (feature_noise > self._rule_noise_threshold[index])
+                & spawn_rolls[index]
+            )
+            if self._rule_requires_deep[index]:
+                fires &= is_deep
+            if self._rule_lava_pool[index]:
+                # Lava pool noise is only sampled where everything else passed
+                for row, col in zip(*np.nonzero(fires)):
+                    fires[row, col] = self._lava_noise_passes(x0 + col, y0 + row)
+            blocks[fires] = self._rule_ids[index]
+            undecided &= ~fires
+
+        return blocks
+
     def update_configuration(self, config: TerrainConfig):
-        """Update the configuration and validate it"""
+        """Update the configuration, validate it and rebuild derived values"""
         issues = config.validate_configuration()
         if issues:
             raise ValueError(f"Configuration validation failed: {issues}")
         self.config = config
+        self.rebuild()
 
     def get_configuration_summary(self):
         """Get a summary of the current configuration"""
-        summary = {
-            "base_layers": len(self.config.base_layers),
-            "feature_rules": len(self.config.feature_rules),
-            "target_distribution": self.config.get_target_distribution(),
-            "validation_issues": self.config.validate_configuration(),
-        }
-        return summary
+        if self._cached_summary_version != self._config_version:
+            self._cached_summary = {
+                "base_layers": len(self.config.base_layers),
+                "feature_rules": len(self.config.feature_rules),
+                "target_distribution": self.config.get_target_distribution(),
+                "validation_issues": self.config.validate_configuration(),
+            }
+            self._cached_summary_version = self._config_version
+        return dict(self._cached_summary)
 
 
 # Convenience function for backward compatibility
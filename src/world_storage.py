@@ -3,12 +3,38 @@ import os
 from game_world import GameWorld
 from inventory import Inventory
 from block import Block
-from block_type import BlockType
+from block_type import BLOCK_ID, BLOCK_TYPES_BY_ID, BlockType
+
+# Version of the save file layout. Bump it when the layout changes and keep
+# load_world able to read the older versions (saves without it are version 0)
+SAVE_FORMAT_VERSION = 4
+
+# Saves store block types by value; a plain dict lookup skips the Enum call
+_BLOCK_TYPES_BY_VALUE = {block_type.value: block_type for block_type in BlockType}
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, the stdlib encoder is the fallback
+    orjson = None
+
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    _loads = json.loads
 
 
 class WorldStorage:
     def __init__(self):
         self.saves_dir = "saves"
+        # Sorted world names and the saves_dir mtime they were read at; menus
+        # ask for the list on every redraw
+        self._cached_world_list = None
+        self._cached_world_list_mtime = None
         self.ensure_saves_directory()
 
     def ensure_saves_directory(self):
@@ -22,6 +48,7 @@ class WorldStorage:
         inventory = {k.value: v for k, v in world.player.inventory.inventory.items()}
         # Prepare world data
         world_data = {
+            "format_version": SAVE_FORMAT_VERSION,
             "world_name": world_name,
             "player": {
                 "world_x": world.player.world_x,
@@ -30,28 +57,29 @@ class WorldStorage:
                 "inventory": inventory,
                 "active_slot": world.player.inventory.active_slot,
             },
-            "chunks": {},
             "terrain_seed": world.terrain_generator.seed,
+            "chunk_size": world.chunk_size,
+            # Block type values indexed by the ids stored in each chunk
+            "block_palette": [block_type.value for block_type in BLOCK_TYPES_BY_ID],
         }
 
-        # Save chunks
-        for (chunk_x, chunk_y), chunk in world.chunks.items():
-            chunk_key = f"{chunk_x},{chunk_y}"
-            chunk_data = {}
-
-            for (local_x, local_y), block in chunk.items():
-                block_key = f"{local_x},{local_y}"
-                chunk_data[block_key] = {
-                    "type": block.type.value,  # Save as string value
-                    "current_health": block.current_health,
-                }
-
-            world_data["chunks"][chunk_key] = chunk_data
-
-        # Write to file
+        # Write to file, streaming the chunks in one at a time rather than
+        # building them all into world_data first. Encoding goes through orjson
+        # when it is installed and writes compact JSON either way
         filepath = os.path.join(self.saves_dir, f"{world_name}.json")
-        with open(filepath, "w") as f:
-            json.dump(world_data, f, indent=2)
+        with open(filepath, "wb") as f:
+            # world_data without its closing brace, then the chunks as a list of
+            # [chunk_x, chunk_y, chunk_data] with plain integer coordinates
+            f.write(_dumps(world_data)[:-1])
+            f.write(b',"chunks":[')
+            for index, ((chunk_x, chunk_y), chunk) in enumerate(world.chunks.items()):
+                if index:
+                    f.write(b",")
+                f.write(f"[{chunk_x},{chunk_y},".encode())
+                f.write(_dumps(self._encode_chunk(chunk, world.chunk_size)))
+                f.write(b"]")
+            f.write(b"]}")
+        self._cached_world_list = None
 
         return True
 
@@ -59,8 +87,15 @@ class WorldStorage:
         """Load a world from file and return a GameWorld instance"""
 
         filepath = os.path.join(self.saves_dir, f"{world_name}.json")
-        with open(filepath, "r") as f:
-            world_data = json.load(f)
+        with open(filepath, "rb") as f:
+            world_data = _loads(f.read())
+
+        format_version = world_data.get("format_version", 0)
+        if format_version > SAVE_FORMAT_VERSION:
+            raise ValueError(
+                f"World '{world_name}' was saved by a newer version of the game "
+                f"(save format {format_version})"
+            )
 
         # Create new game world instance
         terrain_seed = world_data.get("terrain_seed", 42)
@@ -83,20 +118,29 @@ class WorldStorage:
         game.chunks = {}
 
         # Restore chunks
+        if format_version >= 2:
+            palette = [
+                _BLOCK_TYPES_BY_VALUE[value] for value in world_data["block_palette"]
+            ]
+            chunk_size = world_data["chunk_size"]
+            # Local (x, y) of each row-major index, shared by every chunk
+            positions = [
+                (local_x, local_y)
+                for local_y in range(chunk_size)
+                for local_x in range(chunk_size)
+            ]
         chunks_data = world_data.get("chunks", {})
-        for chunk_key, chunk_data in chunks_data.items():
-            chunk_x, chunk_y = map(int, chunk_key.split(","))
-            chunk = {}
-
-            for block_key, block_data in chunk_data.items():
-                local_x, local_y = map(int, block_key.split(","))
-                # Convert string back to BlockType enum
-                block_type_str = block_data["type"]
-                block_type = BlockType(block_type_str)
-                block = Block(block_type)
-                block.current_health = block_data["current_health"]
-                chunk[(local_x, local_y)] = block
-
+        if format_version < 4:
+            # Older saves key the chunks object by "chunk_x,chunk_y" strings
+            chunks_data = (
+                (*map(int, chunk_key.split(",")), chunk_data)
+                for chunk_key, chunk_data in chunks_data.items()
+            )
+        for chunk_x, chunk_y, chunk_data in chunks_data:
+            if format_version >= 2:
+                chunk = self._decode_chunk(chunk_data, palette, positions)
+            else:
+                chunk = self._decode_legacy_chunk(chunk_data)
             game.chunks[(chunk_x, chunk_y)] = chunk
 
         # Generate any missing chunks around player
@@ -104,26 +148,76 @@ class WorldStorage:
 
         return game
 
+    def _encode_chunk(self, chunk, chunk_size):
+        """Flatten a chunk into a row-major list of type ids, plus the health
+        of the few blocks that are not at full health as [index, health]"""
+        types = []
+        damaged = []
+        for local_y in range(chunk_size):
+            for local_x in range(chunk_size):
+                block = chunk[(local_x, local_y)]
+                if block.current_health != block.max_health:
+                    damaged.append([len(types), block.current_health])
+                types.append(BLOCK_ID[block.type])
+        return {"types": types, "damaged": damaged}
+
+    def _decode_chunk(self, chunk_data, palette, positions):
+        """Rebuild a chunk's Blocks from the data written by _encode_chunk,
+        given the local position of each row-major index"""
+        blocks = [Block(palette[type_id]) for type_id in chunk_data["types"]]
+        chunk = dict(zip(positions, blocks))
+
+        # Format 2 saved every block's health; newer saves only damaged ones
+        if "health" in chunk_data:
+            for block, current_health in zip(blocks, chunk_data["health"]):
+                block.current_health = current_health
+        for index, current_health in chunk_data.get("damaged", ()):
+            blocks[index].current_health = current_health
+        return chunk
+
+    def _decode_legacy_chunk(self, chunk_data):
+        """Rebuild a chunk saved as one {"x,y": {type, current_health}} entry
+        per block (save format versions 0 and 1)"""
+        chunk = {}
+        for block_key, block_data in chunk_data.items():
+            local_x, local_y = map(int, block_key.split(","))
+            # Convert string back to BlockType enum
+            block = Block(_BLOCK_TYPES_BY_VALUE[block_data["type"]])
+            block.current_health = block_data["current_health"]
+            chunk[(local_x, local_y)] = block
+        return chunk
+
     def delete_world(self, world_name: str):
         """Delete a world save file"""
 
         filepath = os.path.join(self.saves_dir, f"{world_name}.json")
         if os.path.exists(filepath):
             os.remove(filepath)
+            self._cached_world_list = None
             return True
         return False
 
     def get_world_list(self):
         """Get list of saved worlds by name"""
-        worlds = []
-
-        if os.path.exists(self.saves_dir):
-            for filename in os.listdir(self.saves_dir):
-                if filename.endswith(".json"):
-                    world_name = filename[:-5]  # Remove .json extension
-                    worlds.append(world_name)
-
-        return sorted(worlds)
+        try:
+            mtime = os.stat(self.saves_dir).st_mtime_ns
+        except FileNotFoundError:
+            return []
+        if (
+            self._cached_world_list is not None
+            and mtime == self._cached_world_list_mtime
+        ):
+            return list(self._cached_world_list)
+
+        with os.scandir(self.saves_dir) as entries:
+            # Strip the .json extension
+            self._cached_world_list = sorted(
+                entry.name[:-5]
+                for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
+            )
+        self._cached_world_list_mtime = mtime
+        return list(self._cached_world_list)
 
     def world_exists(self, world_name: str):
         """Check if a world save file exists"""
@@ -1,15 +1,49 @@
 import pytest
 import pygame
 import os
+import sys
+from unittest.mock import Mock
+from block import Block
+from block_type import BlockType
+
+# Tests never need a real window or sound device; set these for the whole run,
+# before any test (with or without pygame_setup) initialises pygame
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
 
 
 @pytest.fixture(scope="session")
 def pygame_setup():
-    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    # Only the subsystems the game code uses; pygame.init() would also bring
+    # up audio, joystick and the rest
+    pygame.display.init()
+    pygame.font.init()
 
     # need display.set_mode for pygame.image.load.convert_alpha
     # functions called at sprite loading time to work
     pygame.display.set_mode((1, 1))
-    pygame.init()
     yield
     pygame.quit()
+
+
+@pytest.fixture(scope="session")
+def screen(pygame_setup):
+    """One 800x600 surface shared by every test that draws"""
+    return pygame.Surface((800, 600))
+
+
+@pytest.fixture(scope="session")
+def blocks():
+    """One shared Block per type, for tests that only read block state.
+    Tests that mine or damage a block should build their own."""
+    return {block_type: Block(block_type) for block_type in BlockType}
+
+
+@pytest.fixture
+def quit_mocks(monkeypatch):
+    """Replace pygame.quit and sys.exit with Mocks, returned as (quit, exit)"""
+    mock_quit = Mock()
+    mock_exit = Mock()
+    monkeypatch.setattr(pygame, "quit", mock_quit)
+    monkeypatch.setattr(sys, "exit", mock_exit)
+    return mock_quit, mock_exit
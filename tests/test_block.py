@@ -1,10 +1,62 @@
-from unittest.mock import Mock
+import pytest
 from block import Block
 from block_type import BlockType
+from constants import (
+    BLACK,
+    BRIGHT_BLUE,
+    DARK_BROWN,
+    GRASS_GREEN,
+    GRAY,
+    LIGHT_BROWN,
+    RED,
+    SAND_COLOR,
+    WATER_BLUE,
+    WHITE,
+)
 from player import Player
 from inventory import Inventory
 
 
+class FakeGame:
+    """Minimal game stub: every position holds the same block, and
+    replace_block calls are recorded"""
+
+    def __init__(self, block):
+        self.block = block
+        self.replace_calls = []
+
+    def get_block(self, world_x, world_y):
+        return self.block
+
+    def replace_block(self, world_x, world_y, block_type):
+        self.replace_calls.append((world_x, world_y, block_type))
+
+
+# (type, walkable, color, minable, mining difficulty) for every block type
+BLOCK_SPECS = [
+    (BlockType.GRASS, True, GRASS_GREEN, False, 1.0),
+    (BlockType.DIRT, True, DARK_BROWN, False, 1.0),
+    (BlockType.SAND, True, SAND_COLOR, False, 1.0),
+    (BlockType.WOOD, False, LIGHT_BROWN, True, 1.5),
+    (BlockType.STONE, False, GRAY, True, 5.0),
+    (BlockType.COAL, False, BLACK, True, 4.0),
+    (BlockType.LAVA, False, RED, False, 1.0),
+    (BlockType.DIAMOND, False, BRIGHT_BLUE, True, 8.0),
+    (BlockType.WATER, False, WATER_BLUE, False, 1.0),
+    (BlockType.STICK, False, WHITE, False, 1.0),
+    (BlockType.TORCH, False, WHITE, False, 1.0),
+]
+
+# (type, damage per hit, [(destroyed, health after the hit), ...])
+DAMAGE_TRACES = [
+    # Unminable blocks ignore damage
+    (BlockType.GRASS, [1.0], [(False, 1.0)]),
+    (BlockType.WOOD, [1.0], [(False, 0.5)]),
+    (BlockType.WOOD, [1.5], [(True, 0.0)]),
+    (BlockType.WOOD, [0.5, 0.5, 0.5], [(False, 1.0), (False, 0.5), (True, 0.0)]),
+]
+
+
 class TestBlock:
 
     def test_place_block_success(self):
@@ -14,29 +66,36 @@ class TestBlock:
         player.orientation = "north"
         player.inventory = Inventory({BlockType.DIRT: 2})
 
-        mock_game = Mock()
-        mock_block = Mock()
-        mock_block.type.walkable = True
-        mock_game.get_block.return_value = mock_block
-
-        # Patch get_top_inventory_items to return the correct block type in slot 0
-        player.get_top_inventory_items = lambda count=5: [(BlockType.DIRT, 2)]
+        game = FakeGame(Block(BlockType.GRASS))
 
-        player.place_block(mock_game)
+        player.place_block(game)
 
         # Target position should be (5, 9) for north
-        mock_game.replace_block.assert_called_once_with(5, 9, BlockType.DIRT)
+        assert game.replace_calls == [(5, 9, BlockType.DIRT)]
         assert player.inventory.inventory[BlockType.DIRT] == 1
 
 
 class TestBlockMining:
 
-    def test_grass_block_not_minable(self):
-        block = Block(BlockType.GRASS)
-        assert block.type.minable is False
-        assert block.type.mining_difficulty == 1.0
-        assert block.max_health == 1.0
-        assert block.current_health == 1.0
+    def test_block_specs_cover_every_type(self):
+        assert [spec[0] for spec in BLOCK_SPECS] == list(BlockType)
+
+    @pytest.mark.parametrize(
+        "block_type,walkable,color,minable,difficulty",
+        BLOCK_SPECS,
+    )
+    def test_block_spec(self, blocks, block_type, walkable, color, minable, difficulty):
+        assert block_type.walkable is walkable
+        assert block_type.color == color
+        assert block_type.minable is minable
+        assert block_type.mining_difficulty == difficulty
+
+        # Blocks mirror their type's flags and start at full health
+        block = blocks[block_type]
+        assert block.walkable is walkable
+        assert block.minable is minable
+        assert block.max_health == difficulty
+        assert block.current_health == difficulty
 
     def test_reset_health(self):
         block = Block(BlockType.WOOD)
@@ -46,38 +105,10 @@ class TestBlockMining:
 
         assert block.current_health == block.max_health
 
-    def test_take_damage_not_minable(self):
-        block = Block(BlockType.GRASS)
-
-        result = block.take_damage(1.0)
-
-        assert result is False
-        assert block.current_health == block.max_health
-
-    def test_take_damage_minable_not_destroyed(self):
-        block = Block(BlockType.WOOD)
-
-        result = block.take_damage(1.0)
-
-        assert result is False
-        assert block.current_health == 0.5
-
-    def test_take_damage_minable_destroyed(self):
-        block = Block(BlockType.WOOD)
-
-        result = block.take_damage(1.5)
-
-        assert result is True
-        assert block.current_health == 0.0
-
-    def test_take_damage_multiple_hits(self):
-        block = Block(BlockType.WOOD)
+    @pytest.mark.parametrize("block_type,hits,expected", DAMAGE_TRACES)
+    def test_damage_trace(self, block_type, hits, expected):
+        block = Block(block_type)
 
-        result1 = block.take_damage(0.5)
-        result2 = block.take_damage(0.5)
-        result3 = block.take_damage(0.5)
+        trace = [(block.take_damage(hit), block.current_health) for hit in hits]
 
-        assert result1 is False
-        assert result2 is False
-        assert result3 is True
-        assert block.current_health == 0.0
+        assert trace == expected
@@ -1,7 +1,12 @@
+from math import isclose
 import pytest
 from camera import Camera
 from constants import WINDOW_SIZE, GRID_SIZE, GAME_HEIGHT
 
+# Whole tiles visible either side of the camera, before get_visible_bounds' margin
+HALF_WIDTH = WINDOW_SIZE[0] // (2 * GRID_SIZE)
+HALF_HEIGHT = GAME_HEIGHT // (2 * GRID_SIZE)
+
 
 class TestCamera:
     def test_camera_initialization(self):
@@ -82,13 +87,10 @@ class TestCamera:
         left, right, top, bottom = camera.get_visible_bounds()
 
         # Should be symmetric around origin
-        half_width = WINDOW_SIZE[0] // (2 * GRID_SIZE)
-        half_height = GAME_HEIGHT // (2 * GRID_SIZE)
-
-        assert left == -half_width - 2
-        assert right == half_width + 2
-        assert top == -half_height - 2
-        assert bottom == half_height + 2
+        assert left == -HALF_WIDTH - 2
+        assert right == HALF_WIDTH + 2
+        assert top == -HALF_HEIGHT - 2
+        assert bottom == HALF_HEIGHT + 2
 
     def test_get_visible_bounds_offset(self):
         camera = Camera()
@@ -98,13 +100,10 @@ class TestCamera:
         left, right, top, bottom = camera.get_visible_bounds()
 
         # Should be offset by camera position
-        half_width = WINDOW_SIZE[0] // (2 * GRID_SIZE)
-        half_height = GAME_HEIGHT // (2 * GRID_SIZE)
-
-        assert left == 10 - half_width - 2
-        assert right == 10 + half_width + 2
-        assert top == 20 - half_height - 2
-        assert bottom == 20 + half_height + 2
+        assert left == 10 - HALF_WIDTH - 2
+        assert right == 10 + HALF_WIDTH + 2
+        assert top == 20 - HALF_HEIGHT - 2
+        assert bottom == 20 + HALF_HEIGHT + 2
 
     def test_visible_bounds_include_buffer(self):
         camera = Camera()
@@ -114,16 +113,13 @@ class TestCamera:
         left, right, top, bottom = camera.get_visible_bounds()
 
         # Bounds should include 2-unit buffer on each side
-        half_width = WINDOW_SIZE[0] // (2 * GRID_SIZE)
-        half_height = GAME_HEIGHT // (2 * GRID_SIZE)
-
         visible_width = right - left + 1
         visible_height = bottom - top + 1
 
         assert (
-            visible_width == 2 * half_width + 5
+            visible_width == 2 * HALF_WIDTH + 5
         )  # +5 for buffer on both sides plus center
-        assert visible_height == 2 * half_height + 5
+        assert visible_height == 2 * HALF_HEIGHT + 5
 
     @pytest.mark.parametrize(
         "target_x,target_y,smoothing",
@@ -142,8 +138,8 @@ class TestCamera:
             camera.update(target_x, target_y, 0.016)
 
         # Should be very close to target
-        assert abs(camera.x - target_x) < 0.01
-        assert abs(camera.y - target_y) < 0.01
+        assert isclose(camera.x, target_x, abs_tol=0.01)
+        assert isclose(camera.y, target_y, abs_tol=0.01)
 
     def test_coordinate_transformation_consistency(self):
         camera = Camera()
@@ -1,4 +1,6 @@
+import pytest
 import pygame
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 from game import Game
 from game import GameState
@@ -7,9 +9,8 @@ from game import GameState
 class TestGameLoop:
     """Test the main game loop functionality"""
 
-    def test_game_initialization_with_screen(self, pygame_setup):
+    def test_game_initialization_with_screen(self, screen):
         """Test game initialization with a provided screen"""
-        screen = pygame.Surface((800, 600))
         game = Game(screen=screen)
 
         assert game.screen == screen
@@ -29,101 +30,113 @@ class TestGameLoop:
             assert game.running == True
             assert game.game_state == GameState.MENU
 
-    def test_quit_method(self, pygame_setup):
+    def test_quit_method(self, screen, quit_mocks):
         """Test the quit method"""
-        screen = pygame.Surface((800, 600))
         game = Game(screen=screen)
+        mock_quit, mock_exit = quit_mocks
 
-        with patch("pygame.quit") as mock_quit, patch("sys.exit") as mock_exit:
+        game.quit()
 
-            game.quit()
+        assert game.running == False
+        mock_quit.assert_called_once()
+        mock_exit.assert_called_once()
 
-            assert game.running == False
-            mock_quit.assert_called_once()
-            mock_exit.assert_called_once()
+
+@pytest.fixture
+def stubbed_game(screen):
+    """A Game with its menu and world storage stubbed by Mocks
+
+    Tests pick the menu action by setting menu_system.handle_event.return_value.
+    """
+    game = Game(screen=screen)
+    game.menu_system.handle_event = Mock()
+    game.world_manager.create_new_world_unsaved = Mock()
+    game.world_manager.load_world = Mock()
+    game.world_manager.save_world = Mock()
+    return game
 
 
 class TestEventHandling:
     """Test event handling in the game loop"""
 
-    def test_handle_keydown_menu_quit(self, pygame_setup):
+    def test_handle_keydown_menu_quit(self, stubbed_game, quit_mocks):
         """Test handling keydown quit action in menu"""
-        screen = pygame.Surface((800, 600))
-        game = Game(screen=screen)
-
-        # Mock menu system returning quit action
-        game.menu_system.handle_event = Mock(return_value="quit")
-
-        keydown_event = Mock()
-        keydown_event.key = pygame.K_ESCAPE
-
-        with patch("pygame.quit") as mock_quit, patch("sys.exit") as mock_exit:
-
-            game._handle_keydown(keydown_event)
-
-            mock_quit.assert_called_once()
-            mock_exit.assert_called_once()
-
-    def test_handle_keydown_create_world(self, pygame_setup):
-        """Test handling create world action"""
-        screen = pygame.Surface((800, 600))
-        game = Game(screen=screen)
-
-        # Mock menu system returning create world action with no name
-        game.menu_system.handle_event = Mock(return_value=("create_world", None))
-        game.world_manager.create_new_world_unsaved = Mock(return_value=Mock())
-
-        keydown_event = Mock()
-        keydown_event.key = pygame.K_RETURN
-
-        game._handle_keydown(keydown_event)
-
-        assert game.game_state == GameState.PLAYING
-        assert game.current_world_name is None  # No name until saved
-        assert game.current_game_world is not None
-
-    def test_handle_keydown_load_world(self, pygame_setup):
-        """Test handling load world action"""
-        screen = pygame.Surface((800, 600))
-        game = Game(screen=screen)
-
-        # Mock menu system returning load world action
-        game.menu_system.handle_event = Mock(
-            return_value=("load_world", "existing_world")
-        )
-        game.world_manager.load_world = Mock(return_value=Mock())
-
-        keydown_event = Mock()
-        keydown_event.key = pygame.K_RETURN
-
-        game._handle_keydown(keydown_event)
-
-        assert game.game_state == GameState.PLAYING
-        assert game.current_game_world is not None
-
-    def test_handle_keydown_playing_escape(self, pygame_setup):
-        """Test handling escape key in playing state"""
-        screen = pygame.Surface((800, 600))
-        game = Game(screen=screen)
-        game.game_state = GameState.PLAYING
-        game.current_game_world = Mock()
+        game = stubbed_game
+        game.menu_system.handle_event.return_value = "quit"
 
-        keydown_event = Mock()
-        keydown_event.key = pygame.K_ESCAPE
+        keydown_event = SimpleNamespace(key=pygame.K_ESCAPE)
+        mock_quit, mock_exit = quit_mocks
 
         game._handle_keydown(keydown_event)
 
-        assert game.game_state == GameState.PAUSED
-
-    def test_handle_keydown_playing_game_input(self, pygame_setup):
+        mock_quit.assert_called_once()
+        mock_exit.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "initial_state,menu_action,key,expected_state,has_world,saves",
+        [
+            (
+                GameState.MENU,
+                ("create_world", None),
+                pygame.K_RETURN,
+                GameState.PLAYING,
+                True,
+                0,
+            ),
+            (
+                GameState.MENU,
+                ("load_world", "existing_world"),
+                pygame.K_RETURN,
+                GameState.PLAYING,
+                True,
+                0,
+            ),
+            (GameState.PLAYING, None, pygame.K_ESCAPE, GameState.PAUSED, True, 0),
+            (GameState.PLAYING, None, pygame.K_c, GameState.CRAFTING, True, 0),
+            (GameState.CRAFTING, None, pygame.K_ESCAPE, GameState.PLAYING, True, 0),
+            (GameState.PAUSED, "resume", pygame.K_RETURN, GameState.PLAYING, True, 0),
+            (
+                GameState.PAUSED,
+                ("save_and_exit", "test_world"),
+                pygame.K_RETURN,
+                GameState.MENU,
+                False,
+                1,
+            ),
+        ],
+    )
+    def test_handle_keydown_state_transitions(
+        self,
+        stubbed_game,
+        initial_state,
+        menu_action,
+        key,
+        expected_state,
+        has_world,
+        saves,
+    ):
+        """Test the game state each keydown (and menu action) leads to"""
+        game = stubbed_game
+        game.game_state = initial_state
+        if initial_state != GameState.MENU:
+            game.current_game_world = Mock()
+        game.menu_system.handle_event.return_value = menu_action
+
+        game._handle_keydown(SimpleNamespace(key=key))
+
+        assert game.game_state == expected_state
+        assert (game.current_game_world is not None) == has_world
+        assert game.world_manager.save_world.call_count == saves
+        if menu_action == ("create_world", None):
+            assert game.current_world_name is None  # No name until saved
+
+    def test_handle_keydown_playing_game_input(self, screen):
         """Test handling game input in playing state"""
-        screen = pygame.Surface((800, 600))
         game = Game(screen=screen)
         game.game_state = GameState.PLAYING
         game.current_game_world = Mock()
 
-        keydown_event = Mock()
-        keydown_event.key = pygame.K_w
+        keydown_event = SimpleNamespace(key=pygame.K_w)
 
         game._handle_keydown(keydown_event)
 
@@ -132,53 +145,13 @@ class TestEventHandling:
             pygame.K_w, game.current_game_world
         )
 
-    def test_handle_keydown_paused_resume(self, pygame_setup):
-        """Test handling resume action in paused state"""
-        screen = pygame.Surface((800, 600))
-        game = Game(screen=screen)
-        game.game_state = GameState.PAUSED
-
-        # Mock menu system returning resume action
-        game.menu_system.handle_event = Mock(return_value="resume")
-
-        keydown_event = Mock()
-        keydown_event.key = pygame.K_RETURN
-
-        game._handle_keydown(keydown_event)
-
-        assert game.game_state == GameState.PLAYING
-
-    def test_handle_keydown_paused_save_and_exit(self, pygame_setup):
-        """Test handling save and exit action in paused state"""
-        screen = pygame.Surface((800, 600))
-        game = Game(screen=screen)
-        game.game_state = GameState.PAUSED
-        game.current_game_world = Mock()
-
-        # Mock menu system returning save and exit action with world name
-        game.menu_system.handle_event = Mock(
-            return_value=("save_and_exit", "test_world")
-        )
-        game.world_manager.save_world = Mock()
-
-        keydown_event = Mock()
-        keydown_event.key = pygame.K_RETURN
-
-        game._handle_keydown(keydown_event)
-
-        assert game.game_state == GameState.MENU
-        assert game.current_game_world is None
-        game.world_manager.save_world.assert_called_once()
-
-    def test_handle_keyup_playing(self, pygame_setup):
+    def test_handle_keyup_playing(self, screen):
         """Test handling keyup events in playing state"""
-        screen = pygame.Surface((800, 600))
         game = Game(screen=screen)
         game.game_state = GameState.PLAYING
         game.current_game_world = Mock()
 
-        keyup_event = Mock()
-        keyup_event.key = pygame.K_w
+        keyup_event = SimpleNamespace(key=pygame.K_w)
 
         game._handle_keyup(keyup_event)
 
@@ -187,16 +160,13 @@ class TestEventHandling:
             pygame.K_w, game.current_game_world
         )
 
-    def test_handle_resize_event(self, pygame_setup):
+    def test_handle_resize_event(self, screen):
         """Test handling window resize events"""
-        screen = pygame.Surface((800, 600))
         game = Game(screen=screen)
         game.game_state = GameState.PLAYING
         game.current_game_world = Mock()
 
-        resize_event = Mock()
-        resize_event.w = 1200
-        resize_event.h = 800
+        resize_event = SimpleNamespace(w=1200, h=800)
 
         with patch("pygame.display.set_mode") as mock_set_mode:
             mock_new_screen = Mock()
@@ -209,14 +179,11 @@ class TestEventHandling:
                 1200, 800
             )
 
-    def test_handle_resize_minimum_size(self, pygame_setup):
+    def test_handle_resize_minimum_size(self, screen):
         """Test resize event respects minimum window size"""
-        screen = pygame.Surface((800, 600))
         game = Game(screen=screen)
 
-        resize_event = Mock()
-        resize_event.w = 500  # Below minimum
-        resize_event.h = 400  # Below minimum
+        resize_event = SimpleNamespace(w=500, h=400)  # Below minimum
 
         with patch("pygame.display.set_mode") as mock_set_mode:
             game._handle_resize(resize_event)
@@ -228,9 +195,8 @@ class TestEventHandling:
 class TestGameUpdates:
     """Test game update and render functionality"""
 
-    def test_update_playing_state(self, pygame_setup):
+    def test_update_playing_state(self, screen):
         """Test update method in playing state"""
-        screen = pygame.Surface((800, 600))
         game = Game(screen=screen)
         game.game_state = GameState.PLAYING
         game.current_game_world = Mock()
@@ -240,9 +206,8 @@ class TestGameUpdates:
 
         game.current_game_world.update_state.assert_called_once_with(dt)
 
-    def test_update_menu_state(self, pygame_setup):
+    def test_update_menu_state(self, screen):
         """Test update method in menu state"""
-        screen = pygame.Surface((800, 600))
         game = Game(screen=screen)
         game.game_state = GameState.MENU
 
@@ -252,9 +217,8 @@ class TestGameUpdates:
         # Should not crash when no game world exists
         assert True  # Just checking no exception is thrown
 
-    def test_render_menu_state(self, pygame_setup):
+    def test_render_menu_state(self, screen):
         """Test render method in menu state"""
-        screen = pygame.Surface((800, 600))
         game = Game(screen=screen)
         game.game_state = GameState.MENU
         game.menu_system.draw = Mock()
@@ -263,9 +227,8 @@ class TestGameUpdates:
 
         game.menu_system.draw.assert_called_once()
 
-    def test_render_playing_state(self, pygame_setup):
+    def test_render_playing_state(self, screen):
         """Test render method in playing state"""
-        screen = pygame.Surface((800, 600))
         game = Game(screen=screen)
         game.game_state = GameState.PLAYING
         game.current_game_world = Mock()
@@ -274,9 +237,8 @@ class TestGameUpdates:
 
         game.current_game_world.draw.assert_called_once_with(screen)
 
-    def test_render_paused_state(self, pygame_setup):
+    def test_render_paused_state(self, screen):
         """Test render method in paused state"""
-        screen = pygame.Surface((800, 600))
         game = Game(screen=screen)
         game.game_state = GameState.PAUSED
         game.current_game_world = Mock()
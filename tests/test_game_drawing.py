@@ -1,14 +1,16 @@
-import pygame
+import pytest
 from game_world import GameWorld
 
 
+@pytest.fixture(scope="module")
+def seeded_game_world():
+    """Drawing only reads the world, so one per module is enough"""
+    return GameWorld(terrain_seed=42)
+
+
 class TestGameWorldDrawing:
     """Test drawing methods for GameWorld class"""
 
-    def setup_class(self):
-        self.screen = pygame.Surface((800, 600))
-        self.game_world = GameWorld(terrain_seed=42)
-
-    def test_draw_game_world(self, pygame_setup):
+    def test_draw_game_world(self, seeded_game_world, screen):
         """Test that game_world.draw() can run without errors."""
-        self.game_world.draw(self.screen)
+        seeded_game_world.draw(screen)
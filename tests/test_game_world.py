@@ -1,9 +1,41 @@
+from collections import Counter
+import copy
+import pytest
 from game_world import GameWorld
 from player import Player
 from camera import Camera
 from block import Block
 from block_type import BlockType
 
+# The eight tiles around a position, in the order tests search them
+NEIGHBOR_OFFSETS = [
+    (dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if (dx, dy) != (0, 0)
+]
+
+
+@pytest.fixture(scope="module")
+def shared_game_world():
+    """One GameWorld for tests that only read blocks. Reads may generate
+    chunks, so tests that count chunks or change the world build their own."""
+    return GameWorld()
+
+
+@pytest.fixture(scope="module")
+def starting_game_world():
+    """A just-generated GameWorld, never used directly: see fresh_game_world"""
+    return GameWorld()
+
+
+@pytest.fixture
+def fresh_game_world(starting_game_world):
+    """A GameWorld in its starting state without regenerating its chunks. The
+    chunks dict is copied but its Blocks are shared, so don't modify blocks."""
+    game_world = copy.copy(starting_game_world)
+    game_world.player = Player()
+    game_world.camera = Camera()
+    game_world.chunks = dict(starting_game_world.chunks)
+    return game_world
+
 
 class TestGameWorld:
     def test_game_world_initialization(self):
@@ -14,8 +46,8 @@ class TestGameWorld:
         assert isinstance(game_world.chunks, dict)
         assert len(game_world.chunks) == 25  # 5x5 initial chunks
 
-    def test_chunk_generation_consistency(self):
-        game_world = GameWorld()
+    def test_chunk_generation_consistency(self, shared_game_world):
+        game_world = shared_game_world
 
         # Get the same block multiple times
         block1 = game_world.get_block(0, 0)
@@ -25,9 +57,9 @@ class TestGameWorld:
         # Should be the same block type due to seeded generation
         assert block1.type == block2.type == block3.type
 
-    def test_seeded_world_generation(self):
-        # Create two separate game worlds
-        game_world1 = GameWorld()
+    def test_seeded_world_generation(self, shared_game_world):
+        # Compare a freshly generated world against the shared one
+        game_world1 = shared_game_world
         game_world2 = GameWorld()
 
         # Same coordinates should produce same block types
@@ -37,8 +69,8 @@ class TestGameWorld:
                 block2 = game_world2.get_block(x, y)
                 assert block1.type == block2.type
 
-    def test_chunk_boundaries(self):
-        game_world = GameWorld()
+    def test_chunk_boundaries(self, shared_game_world):
+        game_world = shared_game_world
 
         # Test blocks at chunk boundaries
         block_0_0 = game_world.get_block(0, 0)
@@ -50,8 +82,8 @@ class TestGameWorld:
         assert block_15_15 is not None
         assert block_16_16 is not None
 
-    def test_chunk_coordinate_calculation(self):
-        game_world = GameWorld()
+    def test_chunk_coordinate_calculation(self, shared_game_world):
+        game_world = shared_game_world
 
         # Test chunk coordinate calculation
         assert game_world.get_block(0, 0) is not None  # Chunk (0, 0)
@@ -59,8 +91,8 @@ class TestGameWorld:
         assert game_world.get_block(16, 16) is not None  # Chunk (1, 1)
         assert game_world.get_block(-1, -1) is not None  # Chunk (-1, -1)
 
-    def test_negative_coordinates(self):
-        game_world = GameWorld()
+    def test_negative_coordinates(self, shared_game_world):
+        game_world = shared_game_world
 
         # Test negative world coordinates
         block = game_world.get_block(-10, -10)
@@ -79,19 +111,18 @@ class TestGameWorld:
         }
         assert block.type in valid_types
 
-    def test_block_type_distribution(self):
-        game_world = GameWorld()
+    def test_block_type_distribution(self, shared_game_world):
+        game_world = shared_game_world
 
         # Sample many blocks to verify realistic distribution with noise generation
-        block_types = []
-        for x in range(-50, 51):  # Wider range for noise-based generation
-            for y in range(-50, 51):
-                block = game_world.get_block(x, y)
-                block_types.append(block.type)
-
-        # Count all block types
+        # (wider range for noise-based generation), counting each block type
+        block_types = Counter(
+            game_world.get_block(x, y).type
+            for x in range(-50, 51)
+            for y in range(-50, 51)
+        )
         unique_types = set(block_types)
-        total = len(block_types)
+        total = sum(block_types.values())
 
         # With noise generation, we should have multiple terrain types
         assert (
@@ -99,7 +130,7 @@ class TestGameWorld:
         ), f"Expected at least 3 terrain types, got: {unique_types}"
 
         # Grass should still be the most common, but distribution will vary
-        grass_count = block_types.count(BlockType.GRASS)
+        grass_count = block_types[BlockType.GRASS]
         grass_ratio = grass_count / total
         assert grass_ratio > 0.3, f"Grass ratio too low: {grass_ratio}"
 
@@ -113,8 +144,8 @@ class TestGameWorld:
         # Should have generated a new chunk
         assert len(game_world.chunks) > initial_chunk_count
 
-    def test_player_chunk_area_generation(self):
-        game_world = GameWorld()
+    def test_player_chunk_area_generation(self, fresh_game_world):
+        game_world = fresh_game_world
 
         # Move player to a new area
         game_world.player.world_x = 50
@@ -126,8 +157,8 @@ class TestGameWorld:
         # Should generate new chunks around the player
         assert len(game_world.chunks) > initial_chunk_count
 
-    def test_chunk_storage_format(self):
-        game_world = GameWorld()
+    def test_chunk_storage_format(self, shared_game_world):
+        game_world = shared_game_world
 
         # Access a block to ensure chunk is generated
         game_world.get_block(0, 0)
@@ -140,8 +171,8 @@ class TestGameWorld:
 
 
 class TestGameWorldIntegration:
-    def test_game_world_components_initialization(self):
-        game_world = GameWorld()
+    def test_game_world_components_initialization(self, shared_game_world):
+        game_world = shared_game_world
 
         # Test that all components are properly initialized
         assert isinstance(game_world.player, Player)
@@ -151,8 +182,8 @@ class TestGameWorldIntegration:
         assert game_world.camera.x == 0.0
         assert game_world.camera.y == 0.0
 
-    def test_player_game_world_interaction(self):
-        game_world = GameWorld()
+    def test_player_game_world_interaction(self, fresh_game_world):
+        game_world = fresh_game_world
         initial_x = game_world.player.world_x
         initial_y = game_world.player.world_y
 
@@ -164,29 +195,28 @@ class TestGameWorldIntegration:
             game_world.player.world_y = 0
 
         # Find a walkable block to move to
-        walkable_found = False
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx == 0 and dy == 0:
-                    continue
-                test_x = game_world.player.world_x + dx
-                test_y = game_world.player.world_y + dy
-                test_block = game_world.get_block(test_x, test_y)
-                if test_block and test_block.type.walkable:
-                    # Test movement to walkable block
-                    game_world.player.move(dx, dy, game_world)
-                    assert game_world.player.world_x == test_x
-                    assert game_world.player.world_y == test_y
-                    walkable_found = True
-                    break
-            if walkable_found:
-                break
+        start_x = game_world.player.world_x
+        start_y = game_world.player.world_y
+        walkable_offset = next(
+            (
+                (dx, dy)
+                for dx, dy in NEIGHBOR_OFFSETS
+                if game_world.get_block(start_x + dx, start_y + dy).type.walkable
+            ),
+            None,
+        )
 
         # Should have found at least one walkable block nearby
-        assert walkable_found
+        assert walkable_offset is not None
 
-    def test_camera_follows_player(self):
-        game_world = GameWorld()
+        # Test movement to walkable block
+        dx, dy = walkable_offset
+        game_world.player.move(dx, dy, game_world)
+        assert game_world.player.world_x == start_x + dx
+        assert game_world.player.world_y == start_y + dy
+
+    def test_camera_follows_player(self, fresh_game_world):
+        game_world = fresh_game_world
 
         # Move player
         game_world.player.world_x = 10
@@ -200,8 +230,9 @@ class TestGameWorldIntegration:
         # Camera should move toward player
         assert game_world.camera.x != 0.0 or game_world.camera.y != 0.0
 
-    def test_world_generation_around_player(self):
-        game_world = GameWorld()
+    @pytest.mark.slow
+    def test_world_generation_around_player(self, fresh_game_world):
+        game_world = fresh_game_world
         initial_chunks = len(game_world.chunks)
 
         # Move player far away
@@ -214,8 +245,8 @@ class TestGameWorldIntegration:
         # Should have generated new chunks
         assert len(game_world.chunks) > initial_chunks
 
-    def test_player_collision_system(self):
-        game_world = GameWorld()
+    def test_player_collision_system(self, fresh_game_world):
+        game_world = fresh_game_world
 
         # Test collision with different block types
         # This tests the integration between player movement and world state
@@ -251,8 +282,9 @@ class TestGameWorldIntegration:
         # Should have tested at least one move
         assert moves_tested > 0
 
-    def test_chunk_generation_consistency_with_player(self):
-        game_world = GameWorld()
+    @pytest.mark.slow
+    def test_chunk_generation_consistency_with_player(self, fresh_game_world):
+        game_world = fresh_game_world
 
         # Get initial chunk count
         initial_chunks = len(game_world.chunks)
@@ -275,8 +307,8 @@ class TestGameWorldIntegration:
         assert block is not None
         assert block.type in [BlockType.GRASS, BlockType.WOOD]
 
-    def test_game_world_state_persistence(self):
-        game_world = GameWorld()
+    def test_game_world_state_persistence(self, fresh_game_world):
+        game_world = fresh_game_world
 
         # Make changes to game world state
         original_x = game_world.player.world_x
@@ -300,8 +332,8 @@ class TestGameWorldIntegration:
         block = game_world.get_block(5, 10)
         assert block is not None
 
-    def test_boundary_conditions(self):
-        game_world = GameWorld()
+    def test_boundary_conditions(self, shared_game_world):
+        game_world = shared_game_world
 
         # Test extreme coordinates
         extreme_coords = [
@@ -328,8 +360,9 @@ class TestGameWorldIntegration:
             ]
             assert block.type in valid_types
 
-    def test_multiple_chunk_generation_cycles(self):
-        game_world = GameWorld()
+    @pytest.mark.slow
+    def test_multiple_chunk_generation_cycles(self, fresh_game_world):
+        game_world = fresh_game_world
 
         # Simulate player moving around, triggering multiple chunk generations
         positions = [(0, 0), (50, 0), (50, 50), (0, 50), (-50, 0), (-50, -50)]
@@ -433,10 +466,16 @@ class TestBlockReplacement:
             (BlockType.WATER, False, False),  # not walkable, not minable
         ]
 
-        for block_type, expected_walkable, expected_minable in test_cases:
-            game_world.replace_block(0, 0, block_type)
-            block = game_world.get_block(0, 0)
+        # Place each case in its own cell first, then check them all
+        for x, (block_type, _, _) in enumerate(test_cases):
+            game_world.replace_block(x, 0, block_type)
+
+        for x, (block_type, expected_walkable, expected_minable) in enumerate(
+            test_cases
+        ):
+            block = game_world.get_block(x, 0)
 
+            assert block.type == block_type
             assert (
                 block.type.walkable == expected_walkable
             ), f"{block_type} walkable mismatch"
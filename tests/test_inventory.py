@@ -66,3 +66,20 @@ class TestInventory:
         inventory.active_slot = 5
 
         assert inventory.get_active_block_type() is None
+
+    def test_get_top_inventory_items_reflects_changes(self):
+        inventory = Inventory()
+        inventory.add(BlockType.WOOD)
+        assert inventory.get_top_inventory_items(5) == [(BlockType.WOOD, 1)]
+
+        inventory.add(BlockType.WOOD)
+        inventory.add(BlockType.STONE)
+        assert inventory.get_top_inventory_items(5) == [
+            (BlockType.WOOD, 2),
+            (BlockType.STONE, 1),
+        ]
+
+        inventory.remove(BlockType.WOOD)
+        inventory.remove(BlockType.WOOD)
+        assert inventory.get_top_inventory_items(5) == [(BlockType.STONE, 1)]
+        assert inventory.get_top_inventory_items(0) == []
@@ -1,6 +1,6 @@
 import pytest
 from unittest.mock import Mock
-from pygame.locals import K_a, K_d, K_w, K_s
+from pygame.locals import K_a, K_d, K_w, K_s, K_UP
 from player import Player
 from block_type import BlockType
 
@@ -166,15 +166,32 @@ class TestPlayer:
         mock_game = Mock()
 
         # Initially no keys pressed
-        assert len(player.pressed_keys) == 0
+        assert player._dir_mask == 0
 
         # Press a key
         player.handle_keydown(K_w, mock_game)
-        assert K_w in player.pressed_keys
+        assert player._dir_mask != 0
 
         # Release the key
         player.handle_keyup(K_w, mock_game)
-        assert K_w not in player.pressed_keys
+        assert player._dir_mask == 0
+
+    def test_releasing_one_of_two_keys_for_same_direction(self):
+        """Test that W and UP are tracked independently"""
+        player = Player()
+        mock_game = Mock()
+        mock_block = Mock()
+        mock_block.walkable = True
+        mock_game.get_block.return_value = mock_block
+
+        player.orientation = "north"
+        player.handle_keydown(K_w, mock_game)
+        player.handle_keydown(K_UP, mock_game)
+        player.handle_keyup(K_UP, mock_game)
+
+        # W is still held, so the player keeps moving north
+        player.update(player.move_interval, mock_game)
+        assert player.world_y == -1
 
     def test_continuous_movement_while_held(self):
         """Test that movement continues while key is held"""
@@ -229,19 +246,20 @@ class TestMining:
         player = Player()
         mock_game = Mock()
         mock_block = Mock()
-        mock_block.type.minable = True
+        mock_block.minable = True
         mock_game.get_block.return_value = mock_block
 
         player.start_mining(mock_game)
 
         assert player.is_mining is True
         assert player.mining_target == (0, 1)  # South of origin (default orientation)
+        assert player.mining_block is mock_block
 
     def test_start_mining_non_minable_block(self):
         player = Player()
         mock_game = Mock()
         mock_block = Mock()
-        mock_block.type.minable = False
+        mock_block.minable = False
         mock_game.get_block.return_value = mock_block
 
         player.start_mining(mock_game)
@@ -263,16 +281,18 @@ class TestMining:
         player = Player()
         player.is_mining = True
         player.mining_target = (5, 10)
+        mock_block = Mock()
+        player.mining_block = mock_block
 
         mock_game = Mock()
-        mock_block = Mock()
-        mock_game.get_block.return_value = mock_block
 
         player.stop_mining(mock_game)
 
         assert player.is_mining is False
         assert player.mining_target is None
+        assert player.mining_block is None
         mock_block.reset_health.assert_called_once()
+        mock_game.get_block.assert_not_called()
 
     def test_stop_mining_no_target(self):
         player = Player()
@@ -293,13 +313,14 @@ class TestMining:
 
         mock_game = Mock()
         mock_block = Mock()
-        mock_block.type.minable = True
+        mock_block.minable = True
         mock_block.take_damage.return_value = False  # Block not destroyed
-        mock_game.get_block.return_value = mock_block
+        player.mining_block = mock_block
 
         player.process_mining(0.5, mock_game)  # 0.5 seconds
 
         mock_block.take_damage.assert_called_once_with(0.5)  # 1.0 * 0.5
+        mock_game.get_block.assert_not_called()
 
     def test_process_mining_destroys_block(self):
         player = Player()
@@ -308,11 +329,11 @@ class TestMining:
 
         mock_game = Mock()
         mock_block = Mock()
-        mock_block.type.minable = True
+        mock_block.minable = True
         mock_block.take_damage.return_value = True  # Block destroyed
         mock_block.type.mining_result = BlockType.WOOD
         mock_block.type.replacement_block = BlockType.DIRT
-        mock_game.get_block.return_value = mock_block
+        player.mining_block = mock_block
 
         player.process_mining(1.0, mock_game)
 
@@ -321,6 +342,7 @@ class TestMining:
         mock_game.replace_block.assert_called_once_with(5, 10, BlockType.DIRT)
         assert player.is_mining is False
         assert player.mining_target is None
+        assert player.mining_block is None
 
     def test_process_mining_no_target(self):
         player = Player()
@@ -367,11 +389,13 @@ class TestMining:
         player.is_mining = True
         player.mining_target = (5, 10)
 
+        mock_mining_block = Mock()
+        player.mining_block = mock_mining_block
+
         mock_game = Mock()
         mock_walkable_block = Mock()
         mock_walkable_block.walkable = True
-        mock_mining_block = Mock()
-        mock_game.get_block.side_effect = [mock_walkable_block, mock_mining_block]
+        mock_game.get_block.return_value = mock_walkable_block
 
         player.move(1, 0, mock_game)
 
@@ -388,9 +412,9 @@ class TestMining:
 
         mock_game = Mock()
         mock_block = Mock()
-        mock_block.type.minable = True
+        mock_block.minable = True
         mock_block.take_damage.return_value = False
-        mock_game.get_block.return_value = mock_block
+        player.mining_block = mock_block
 
         player.update(0.1, mock_game)
 
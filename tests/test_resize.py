@@ -2,12 +2,9 @@
 Tests for window resize functionality
 """
 
-import pygame
-from src.menu import MenuSystem
-from src.game_world import GameWorld
-from src.camera import Camera
-from src.menu import MenuSystem
-from src.lighting import lighting_system
+from menu import MenuSystem
+from game_world import GameWorld
+from camera import Camera
 from block_type import BlockType
 from unittest.mock import Mock
 
@@ -15,7 +12,7 @@ from unittest.mock import Mock
 class TestWindowResize:
     """Test window resize functionality"""
 
-    def test_camera_resize_updates_dimensions(self, pygame_setup):
+    def test_camera_resize_updates_dimensions(self):
         """Test that camera dimensions update correctly on resize"""
         camera = Camera()
 
@@ -29,7 +26,7 @@ class TestWindowResize:
         assert camera.window_height == 800
         assert camera.game_height == 800 - 120  # Subtract inventory height
 
-    def test_camera_visible_bounds_change_with_resize(self, pygame_setup):
+    def test_camera_visible_bounds_change_with_resize(self):
         """Test that visible bounds change appropriately with window resize"""
         camera = Camera()
 
@@ -48,7 +45,7 @@ class TestWindowResize:
             larger_bounds[3] - larger_bounds[2] > initial_bounds[3] - initial_bounds[2]
         )  # height
 
-    def test_camera_world_to_screen_updates_with_resize(self, pygame_setup):
+    def test_camera_world_to_screen_updates_with_resize(self):
         """Test that world-to-screen conversion updates with resize"""
         camera = Camera()
 
@@ -110,7 +107,7 @@ class TestWindowResize:
 class TestResizeEdgeCases:
     """Test edge cases for resize functionality"""
 
-    def test_camera_minimum_size_handling(self, pygame_setup):
+    def test_camera_minimum_size_handling(self):
         """Test camera behavior with very small window sizes"""
         camera = Camera()
 
@@ -126,7 +123,7 @@ class TestResizeEdgeCases:
         assert isinstance(screen_x, (int, float))
         assert isinstance(screen_y, (int, float))
 
-    def test_camera_large_size_handling(self, pygame_setup):
+    def test_camera_large_size_handling(self):
         """Test camera behavior with very large window sizes"""
         camera = Camera()
 
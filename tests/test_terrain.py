@@ -1,6 +1,9 @@
 import random
+import numpy as np
 from game_world import GameWorld
-from block_type import BlockType
+from block_type import BLOCK_ID, BLOCK_TYPES_BY_ID, BlockType
+from terrain_config import TerrainConfig
+from terrain_generator import ConfigurableTerrainGenerator, create_terrain_generator
 
 
 class TestNoiseGeneration:
@@ -67,3 +70,121 @@ class TestNoiseGeneration:
             for y in range(20):
                 block = game_world.get_block(x, y)
                 assert block.type in valid_types, f"Invalid block type: {block.type}"
+
+    def test_generate_chunk_matches_generate_block_type(self):
+        generator = create_terrain_generator(seed=42)
+
+        # A stony area so feature rules (coal) are exercised as well
+        x0, y0 = 2000, -1500
+        blocks = generator.generate_chunk(x0, y0, 16, 12)
+
+        assert blocks.shape == (12, 16)
+        assert blocks.dtype == np.int8
+        for row in range(12):
+            for col in range(16):
+                expected = generator.generate_block_type(x0 + col, y0 + row)
+                assert BLOCK_TYPES_BY_ID[blocks[row, col]] == expected
+
+    def test_classify_base_matches_layer_thresholds(self):
+        generator = create_terrain_generator(seed=42)
+
+        noise_values = np.array([0.0, 0.42, 0.5, 0.59, 0.99])
+        assert [
+            BLOCK_TYPES_BY_ID[i] for i in generator.classify_base(noise_values)
+        ] == [
+            BlockType.WATER,
+            BlockType.SAND,
+            BlockType.GRASS,
+            BlockType.STONE,
+            BlockType.STONE,
+        ]
+
+    def test_update_configuration_refreshes_classification(self):
+        generator = create_terrain_generator(seed=42)
+
+        config = TerrainConfig()
+        config.base_layers[0].threshold = 0.45
+        generator.update_configuration(config)
+
+        assert generator.classify_base(np.array([0.44]))[0] == BLOCK_ID[BlockType.WATER]
+
+    def test_hash_uniform_is_repeatable_and_in_range(self):
+        generator = create_terrain_generator(seed=42)
+        xs = np.arange(-50, 50)[np.newaxis, :]
+        ys = np.arange(-50, 50)[:, np.newaxis]
+
+        values = generator._hash_uniform(xs, ys, 0)
+
+        assert values.shape == (100, 100)
+        assert values.min() >= 0.0 and values.max() < 1.0
+        assert np.array_equal(values, generator._hash_uniform(xs, ys, 0))
+        assert not np.array_equal(values, generator._hash_uniform(xs, ys, 1))
+
+    def test_generate_chunk_matches_generate_block_type_deep_features(self):
+        # Make deep areas and lava pools common so those rules are exercised
+        config = TerrainConfig()
+        config.noise_params["stone_threshold"] = 0.55
+        config.noise_params["lava_pool_threshold"] = 0.0
+        config.get_feature_rule_by_name(BlockType.LAVA).noise_threshold = -1.0
+        generator = ConfigurableTerrainGenerator(config, seed=42)
+
+        x0, y0 = 2000, -1500
+        blocks = generator.generate_chunk(x0, y0, 16, 12)
+
+        assert BLOCK_ID[BlockType.LAVA] in blocks
+        for row in range(12):
+            for col in range(16):
+                expected = generator.generate_block_type(x0 + col, y0 + row)
+                assert BLOCK_TYPES_BY_ID[blocks[row, col]] == expected
+
+    def test_should_place_lava_pool_uses_given_base_noise(self):
+        generator = create_terrain_generator(seed=42)
+
+        # Shallow base noise rules out lava without sampling anything else
+        assert not generator.should_place_lava_pool(0, 0, base_noise=0.0)
+        assert generator.should_place_lava_pool(
+            0, 0, base_noise=1.0
+        ) == generator._lava_noise_passes(0, 0)
+
+    def test_rebuild_picks_up_in_place_config_changes(self):
+        config = TerrainConfig()
+        generator = ConfigurableTerrainGenerator(config, seed=42)
+
+        config.base_layers[0].threshold = 0.45
+        assert generator.classify_base(np.array([0.44]))[0] == BLOCK_ID[BlockType.SAND]
+
+        generator.rebuild()
+        assert generator.classify_base(np.array([0.44]))[0] == BLOCK_ID[BlockType.WATER]
+
+    def test_configuration_summary_refreshes_on_rebuild(self):
+        config = TerrainConfig()
+        generator = ConfigurableTerrainGenerator(config, seed=42)
+        assert generator.get_configuration_summary()["base_layers"] == 4
+
+        config.base_layers.pop()
+        assert generator.get_configuration_summary()["base_layers"] == 4
+
+        generator.rebuild()
+        assert generator.get_configuration_summary()["base_layers"] == 3
+
+    def test_base_terrain_from_noise_matches_classify_base(self):
+        generator = create_terrain_generator(seed=42)
+
+        # Includes values exactly on each layer threshold
+        noise_values = [0.0, 0.41, 0.42, 0.47, 0.55, 0.6, 1.0]
+        expected = generator.classify_base(np.array(noise_values))
+        for noise_value, block_id in zip(noise_values, expected):
+            block_type = generator.base_terrain_from_noise(noise_value)
+            assert block_type == BLOCK_TYPES_BY_ID[block_id]
+
+    def test_hash_chance_matches_hash_uniform(self):
+        generator = create_terrain_generator(seed=42)
+        xs = np.arange(-20, 20)[np.newaxis, :]
+        ys = np.arange(-20, 20)[:, np.newaxis]
+
+        for channel in range(3):
+            values = generator._hash_uniform(xs, ys, channel)
+            for row, world_y in enumerate(range(-20, 20)):
+                for col, world_x in enumerate(range(-20, 20)):
+                    scalar = generator._hash_chance(world_x, world_y, channel)
+                    assert scalar == values[row, col]
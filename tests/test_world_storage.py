@@ -1,42 +1,161 @@
 from game_world import GameWorld
-from world_storage import WorldStorage
+from world_storage import SAVE_FORMAT_VERSION, WorldStorage
 from unittest import mock
-import pygame
-from block_type import BlockType
+import json
+import os
+import pytest
+from block_type import BLOCK_TYPES_BY_ID, BlockType
+
+
+def read_save_file(world_storage, world_name):
+    with open(os.path.join(world_storage.saves_dir, f"{world_name}.json")) as f:
+        return json.load(f)
 
 
 def test_save_world():
     world = GameWorld()
     world_storage = WorldStorage()
 
-    with mock.patch("json.dump") as mock_dump:
-        assert world_storage.save_world(world, "test_name")
-        mock_dump.assert_called_once()
+    assert world_storage.save_world(world, "test_name")
 
-        args, _ = mock_dump.call_args
-        assert args[0]["world_name"] == "test_name"
+    saved_data = read_save_file(world_storage, "test_name")
+    world_storage.delete_world("test_name")
+    assert saved_data["world_name"] == "test_name"
+    assert saved_data["format_version"] == SAVE_FORMAT_VERSION
+    chunk_keys = {(chunk_x, chunk_y) for chunk_x, chunk_y, _ in saved_data["chunks"]}
+    assert chunk_keys == world.chunks.keys()
 
 
-def test_save_and_load_same_world(pygame_setup):
+def test_save_and_load_same_world(screen):
     world = GameWorld()
     world_storage = WorldStorage()
-    screen = pygame.Surface((800, 600))
 
     # many draw time bugs from bad serialization
     # only surface with inventory items.
     world.player.add_to_inventory(BlockType.WOOD)
 
-    with mock.patch("json.dump") as mock_dump:
-        world_storage.save_world(world, "test_name")
-        mock_dump.assert_called_once()
-        args, _ = mock_dump.call_args
-        dumped_dict = args[0]
-        assert dumped_dict["world_name"] == "test_name"
+    world_storage.save_world(world, "test_name")
+    assert read_save_file(world_storage, "test_name")["world_name"] == "test_name"
+
+    loaded_world = world_storage.load_world("test_name")
+    world_storage.delete_world("test_name")
+    assert len(loaded_world.chunks) == len(world.chunks)
+
+    # ensure loaded world can be drawn without error
+    loaded_world.draw(screen)
+
+
+def test_load_rejects_newer_save_format():
+    world_storage = WorldStorage()
+    world_storage.save_world(GameWorld(), "test_name")
+
+    saved_data = read_save_file(world_storage, "test_name")
+    saved_data["format_version"] = SAVE_FORMAT_VERSION + 1
+    with open(os.path.join(world_storage.saves_dir, "test_name.json"), "w") as f:
+        json.dump(saved_data, f)
+    with pytest.raises(ValueError):
+        world_storage.load_world("test_name")
+    world_storage.delete_world("test_name")
+
+
+def test_save_and_load_round_trips_blocks():
+    world = GameWorld()
+    world_storage = WorldStorage()
+    world.replace_block(3, 4, BlockType.STONE)
+    world.get_block(3, 4).take_damage(1.25)
+
+    world_storage.save_world(world, "test_round_trip")
+    try:
+        loaded_world = world_storage.load_world("test_round_trip")
+    finally:
+        world_storage.delete_world("test_round_trip")
+
+    assert loaded_world.chunks.keys() == world.chunks.keys()
+    for chunk_key, chunk in world.chunks.items():
+        loaded_chunk = loaded_world.chunks[chunk_key]
+        for position, block in chunk.items():
+            assert loaded_chunk[position].type == block.type
+            assert loaded_chunk[position].current_health == block.current_health
+
+
+def test_load_legacy_save_format():
+    world_storage = WorldStorage()
+    legacy_data = {
+        "world_name": "test_legacy",
+        "player": {"world_x": 0, "world_y": 0, "inventory": {}},
+        "terrain_seed": 42,
+        "chunks": {
+            "0,0": {
+                "1,2": {"type": "stone", "current_health": 2.5},
+                "2,1": {"type": "water", "current_health": 1.0},
+            }
+        },
+    }
+
+    with open(os.path.join(world_storage.saves_dir, "test_legacy.json"), "w") as f:
+        json.dump(legacy_data, f, indent=2)
+    try:
+        loaded_world = world_storage.load_world("test_legacy")
+    finally:
+        world_storage.delete_world("test_legacy")
+
+    assert loaded_world.chunks[(0, 0)][(1, 2)].type == BlockType.STONE
+    assert loaded_world.chunks[(0, 0)][(1, 2)].current_health == 2.5
+    assert loaded_world.chunks[(0, 0)][(2, 1)].type == BlockType.WATER
+
+
+def test_load_format_2_health_list():
+    world_storage = WorldStorage()
+    stone_id = BLOCK_TYPES_BY_ID.index(BlockType.STONE)
+    format_2_data = {
+        "format_version": 2,
+        "world_name": "test_format_2",
+        "player": {"world_x": 0, "world_y": 0, "inventory": {}},
+        "terrain_seed": 42,
+        "chunk_size": 2,
+        "block_palette": [block_type.value for block_type in BLOCK_TYPES_BY_ID],
+        "chunks": {"0,0": {"types": [stone_id] * 4, "health": [5.0, 2.5, 5.0, 5.0]}},
+    }
+
+    with open(os.path.join(world_storage.saves_dir, "test_format_2.json"), "w") as f:
+        json.dump(format_2_data, f)
+    try:
+        loaded_world = world_storage.load_world("test_format_2")
+    finally:
+        world_storage.delete_world("test_format_2")
+
+    assert loaded_world.chunks[(0, 0)][(1, 0)].current_health == 2.5
+    assert loaded_world.chunks[(0, 0)][(0, 1)].current_health == 5.0
+
+
+def test_world_list_refreshes_after_save_and_delete():
+    world_storage = WorldStorage()
+    world_storage.delete_world("test_listed")
+    assert "test_listed" not in world_storage.get_world_list()
+
+    world_storage.save_world(GameWorld(), "test_listed")
+    assert "test_listed" in world_storage.get_world_list()
+
+    world_storage.delete_world("test_listed")
+    assert "test_listed" not in world_storage.get_world_list()
+
+
+def test_save_and_load_without_orjson():
+    world = GameWorld()
+    world_storage = WorldStorage()
+    world.player.add_to_inventory(BlockType.WOOD)
+
+    def stdlib_dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode()
 
-        with mock.patch("json.load") as mock_load:
-            mock_load.return_value = dumped_dict
-            loaded_world = world_storage.load_world("test_name")
-            assert len(loaded_world.chunks) == len(world.chunks)
+    with mock.patch("world_storage._dumps", stdlib_dumps), mock.patch(
+        "world_storage._loads", json.loads
+    ):
+        world_storage.save_world(world, "test_stdlib_json")
+        try:
+            loaded_world = world_storage.load_world("test_stdlib_json")
+        finally:
+            world_storage.delete_world("test_stdlib_json")
 
-            # ensure loaded world can be drawn without error
-            loaded_world.draw(screen)
+    assert loaded_world.chunks.keys() == world.chunks.keys()
+    assert loaded_world.player.inventory.inventory == world.player.inventory.inventory